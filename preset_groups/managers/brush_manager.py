@@ -17,10 +17,12 @@ from PyQt5.QtWidgets import QStyle, QStyleOptionFrame
 from ..utils.data_manager import check_common_config, save_common_config
 from ..utils.config_utils import (
     reload_config,
+    invalidate_config_cache,
     get_brush_icon_size,
     get_display_brush_names,
     get_brush_name_font_size,
     get_brush_name_label_height,
+    get_brush_name_chars_per_line,
     get_spacing_between_buttons,
 )
 
@@ -154,6 +156,12 @@ class BrushManagerMixin:
                 col = index % new_columns
                 layout.addWidget(button, row, col)
             
+            # Record the live layout so resize filtering and drop mapping see
+            # the columns actually in use; the last update_grid render no
+            # longer matches, so don't let it short-circuit the next update
+            grid_info["columns"] = new_columns
+            grid_info.pop("_last_render_sig", None)
+            
             # Update grid container height
             preset_count = len(presets)
             button_height = icon_size + name_label_height
@@ -199,9 +207,7 @@ class BrushManagerMixin:
         scale_factor = icon_size / reference_size
         font_size = max(min_font, min(max_font, int(base_font * scale_factor)))
         
-        # Calculate chars per line
-        avg_char_width = font_size * 0.55
-        chars_per_line = max(1, int((icon_size - 4) / avg_char_width))
+        chars_per_line = get_brush_name_chars_per_line(icon_size, font_size)
         
         # Determine max lines needed
         max_lines = 1
@@ -221,10 +227,8 @@ class BrushManagerMixin:
         config = check_common_config()
         config["layout"]["brush_icon_size"] = value
         
-        # Update the module-level cache directly for immediate effect
-        from ..utils import config_utils
-        if config_utils._config_cache:
-            config_utils._config_cache["layout"]["brush_icon_size"] = value
+        # Drop cached lookups so getters see the new size immediately
+        invalidate_config_cache()
         
         # Resize existing buttons in-place (fast, no recreation)
         self._resize_grids_live(value)
@@ -11,7 +11,6 @@ PERFORMANCE OPTIMIZATIONS:
 import re
 from krita import Krita  # type: ignore
 from PyQt5.QtWidgets import (
-    QPushButton,
     QVBoxLayout,
     QHBoxLayout,
     QGridLayout,
@@ -30,7 +29,8 @@ from ..utils.config_utils import (
 )
 from ..utils.styles import GridColors, OverlayColors, tint_icon_for_theme
 from ..widgets.grid_container import ClickableGridWidget, DraggableGridContainer
-from ..widgets.draggable_grid_row import DraggableGridRow
+from ..widgets.draggable_grid_row import DraggableGridRow, GridCollapseButton
+from ..widgets.grid_name_button import GridNameButton
 
 
 # Pattern for auto-generated group names
@@ -75,7 +75,7 @@ class GridManagerMixin:
     
     def _create_collapse_button(self, grid_info, name_button_height):
         """Create and configure the collapse button for a grid."""
-        collapse_button = QPushButton()
+        collapse_button = GridCollapseButton()
         collapse_button.setObjectName("collapse_button")
         
         # Calculate collapse button dimensions based on font size
@@ -97,11 +97,10 @@ class GridManagerMixin:
 
     def _create_name_button(self, grid_info):
         """Create and configure the name button for a grid."""
-        name_button = QPushButton(grid_info["name"])
+        name_button = GridNameButton(grid_info, self)
         name_button.setStyleSheet(_get_name_button_style())
         name_button.drag_start_pos = None
         name_button.is_dragging_grid = False
-        self._setup_name_button_events(name_button, grid_info)
         return name_button
 
     def _add_grid_ui(self, grid_info):
@@ -173,7 +172,7 @@ class GridManagerMixin:
         if not pixmap.isNull():
             scaled = pixmap.scaled(icon_size, icon_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
             # Apply theme-based tinting for light themes
-            tinted = tint_icon_for_theme(scaled)
+            tinted = tint_icon_for_theme(scaled, (icon_name, icon_size))
             collapse_button.setIcon(QIcon(tinted))
         else:
             collapse_button.setIcon(icon)
@@ -500,24 +499,26 @@ class GridManagerMixin:
     def _update_all_grids_on_resize(self):
         """Update all grids with recalculated column count.
         
-        PERFORMANCE: Uses batch updates to minimize repaints.
+        PERFORMANCE: Uses batch updates to minimize repaints. Grids already
+        laid out for the current column count are skipped, so resizes that
+        don't cross a column boundary rebuild nothing.
         """
         # Skip if no grids
         if not self.grids:
             return
         
-        # Disable updates during batch operation
-        if hasattr(self, 'main_widget') and self.main_widget:
-            self.main_widget.setUpdatesEnabled(False)
+        columns = self.get_dynamic_columns()
+        stale_grids = [
+            grid_info for grid_info in self.grids
+            if grid_info.get("layout")
+            and grid_info.get("brush_presets")
+            and grid_info.get("columns") != columns
+        ]
+        if not stale_grids:
+            return
         
-        try:
-            for grid_info in self.grids:
-                if grid_info.get("layout") and grid_info.get("brush_presets"):
-                    self.update_grid(grid_info)
-        finally:
-            # Re-enable updates
-            if hasattr(self, 'main_widget') and self.main_widget:
-                self.main_widget.setUpdatesEnabled(True)
+        # Batch update with repaints suspended
+        self.update_grids(stale_grids)
 
     # --- Grid Drag & Drop Support ---
     
@@ -50,7 +50,7 @@ from .utils.config_utils import (
     get_spacing_between_buttons,
     get_exclusive_uncollapse,
 )
-from .utils.styles import docker_btn_style, WindowColors, OverlayColors, SliderColors
+from .utils.styles import docker_btn_style, SliderColors
 from .dialogs.settings_dialog import CommonConfigDialog
 
 from .managers.brush_manager import BrushManagerMixin
@@ -124,6 +124,7 @@ class PresetGroupsDocker(
         self.main_grid_layout = None
         self.grid_counter = 0
         self.current_selected_preset = None
+        self._current_selected_name = None
         self.current_selected_button = None
         self.brush_buttons = []
         self.selected_buttons = []
@@ -133,6 +134,8 @@ class PresetGroupsDocker(
         self._add_brush_qt_key = Qt.Key_W
         self._save_pending = False
         self._grids_pending_update = set()
+        # Click-vs-drag threshold for grid name buttons (read once, not per release)
+        self._start_drag_distance = QApplication.startDragDistance()
         
         # Cached references (refreshed on relevant signals)
         self._cached_view = None
@@ -219,6 +222,8 @@ class PresetGroupsDocker(
             qt_app = QApplication.instance()
             if qt_app:
                 qt_app.paletteChanged.connect(self._on_theme_changed)
+                # Write out any debounced saves before Krita exits
+                qt_app.aboutToQuit.connect(self._flush_pending_saves)
 
         except Exception as e:
             # Fallback to timer-based approach if signals fail
@@ -423,6 +428,19 @@ class PresetGroupsDocker(
         self._save_pending = False
         save_grids_data(self.data_file, self.grids)
 
+    def _flush_pending_saves(self):
+        """Run debounced disk writes immediately (called on application quit)."""
+        if self._save_pending:
+            self._do_save_grids_data()
+        for timer_name, save in (
+            ('_icon_size_save_timer', self._save_icon_size_to_disk),
+            ('_max_size_save_timer', self._save_max_size_to_disk),
+        ):
+            timer = getattr(self, timer_name, None)
+            if timer is not None and timer.isActive():
+                timer.stop()
+                save()
+
     def init_ui(self):
         """Initialize the docker UI layout.
         
@@ -433,13 +451,13 @@ class PresetGroupsDocker(
         main_layout = QVBoxLayout()
         main_layout.setAlignment(Qt.AlignTop)
         main_layout.setContentsMargins(0, 0, 0, 0)
+        central_widget.setLayout(main_layout)
 
         self._create_top_row(main_layout)
         self._create_grids_section(main_layout)
         self._create_bottom_row(main_layout)
         self.init_drag_tracking()
 
-        central_widget.setLayout(main_layout)
         self.setWidget(central_widget)
         self._initialize_grids()
         
@@ -478,9 +496,14 @@ class PresetGroupsDocker(
 
     def _create_top_row(self, main_layout):
         """Create top controls row with brush size slider and settings."""
+        # Scope the shared icon button stylesheet to this row, and install
+        # it before the buttons are added so they are polished against it
+        top_row_widget = QWidget()
+        self.apply_icon_buttons_stylesheet(top_row_widget)
         top_row_layout = QHBoxLayout()
         top_row_layout.setSpacing(4)
         top_row_layout.setContentsMargins(4, 2, 4, 2)
+        top_row_widget.setLayout(top_row_layout)
 
         self.brush_size_slider = QSlider(Qt.Horizontal)
         self.brush_size_slider.setMinimum(1)
@@ -511,10 +534,8 @@ class PresetGroupsDocker(
         )
         top_row_layout.addWidget(self.setting_btn, 0, Qt.AlignRight)
 
-        top_row_widget = QWidget()
-        top_row_widget.setLayout(top_row_layout)
-        top_row_widget.setFixedHeight(self.setting_btn.sizeHint().height() + 6)
         main_layout.addWidget(top_row_widget)
+        top_row_widget.setFixedHeight(self.setting_btn.sizeHint().height() + 6)
         QTimer.singleShot(0, lambda: self._update_brush_size_number_width(self.max_brush_size))
 
     def _create_grids_section(self, main_layout):
@@ -543,8 +564,13 @@ class PresetGroupsDocker(
 
     def _create_bottom_row(self, main_layout):
         """Create bottom button row with icon size slider and action buttons"""
+        bottom_row_widget = QWidget()
+        self.apply_icon_buttons_stylesheet(bottom_row_widget)
         button_layout = QHBoxLayout()
         button_layout.setSpacing(1)
+        # Match the zero margins the row had as a nested layout
+        button_layout.setContentsMargins(0, 0, 0, 0)
+        bottom_row_widget.setLayout(button_layout)
 
         # Icon size slider
         self.icon_size_slider = QSlider(Qt.Horizontal)
@@ -576,7 +602,7 @@ class PresetGroupsDocker(
         button_layout.addWidget(self.delete_button)
         button_layout.addSpacerItem(QSpacerItem(2, 0, QSizePolicy.Fixed, QSizePolicy.Minimum))
 
-        main_layout.addLayout(button_layout)
+        main_layout.addWidget(bottom_row_widget)
 
     def _initialize_grids(self):
         """Initialize grids from loaded data or create a default grid."""
@@ -718,7 +744,7 @@ class PresetGroupsDocker(
             if not pixmap.isNull():
                 scaled = pixmap.scaled(icon_size, icon_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
                 # Apply theme-based tinting
-                tinted = tint_icon_for_theme(scaled)
+                tinted = tint_icon_for_theme(scaled, (icon_name, icon_size))
                 collapse_button.setIcon(QIcon(tinted))
             else:
                 collapse_button.setIcon(icon)
@@ -736,24 +762,14 @@ class PresetGroupsDocker(
     def _refresh_icon_button_styles(self):
         """Refresh styles and icons for icon buttons (settings, add, delete, etc.).
 
-        Also refreshes icon tinting for theme changes.
-        """
-        icon_button_style = f"""
-            QPushButton {{
-                background-color: {WindowColors.BackgroundNormal};
-                border: none;
-                border-radius: 2px;
-            }}
-            QPushButton:hover {{
-                background-color: {OverlayColors.HoverRgba};
-            }}
+        Re-sets the shared icon button stylesheet on each button row, then
+        refreshes icon tinting for theme changes.
         """
+        for style_host in getattr(self, '_icon_buttons_style_hosts', ()):
+            self.apply_icon_buttons_stylesheet(style_host)
         for btn in self.findChildren(QPushButton):
-            # Skip collapse buttons - they have their own style
-            if btn.objectName() == "collapse_button":
-                continue
-            if btn.text() == "" and btn.icon() and not btn.icon().isNull():
-                btn.setStyleSheet(icon_button_style)
+            # Only buttons created by create_icon_button carry an icon name
+            if btn.property("icon_name"):
                 # Refresh icon with current theme tinting
                 self.refresh_icon_button(btn)
 
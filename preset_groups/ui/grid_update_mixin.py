@@ -13,6 +13,8 @@ from ..utils.config_utils import (
     get_spacing_between_buttons,
     get_display_brush_names,
     get_brush_name_label_height,
+    get_brush_name_font_size,
+    get_brush_name_chars_per_line,
 )
 from ..utils.data_manager import check_common_config
 from ..widgets.draggable_button import DraggableBrushButton
@@ -28,11 +30,7 @@ class GridUpdateMixin:
         else:
             available_widget = self.main_widget if self.main_widget else self.widget()
         
-        if not available_widget:
-            max_brush = check_common_config().get("layout", {}).get("max_brush_per_row", 8)
-            return int(max_brush)
-        
-        available_width = available_widget.width()
+        available_width = available_widget.width() if available_widget else 0
         if available_width <= 0:
             max_brush = check_common_config().get("layout", {}).get("max_brush_per_row", 8)
             return int(max_brush)
@@ -46,20 +44,16 @@ class GridUpdateMixin:
         if button_size + spacing <= 0:
             return 1
         
-        max_columns = max(1, int((usable_width + spacing) / (button_size + spacing)))
+        max_columns = max(1, (usable_width + spacing) // (button_size + spacing))
         return max_columns
     
-    def _store_selected_indices(self, layout):
-        """Store indices of selected buttons before clearing"""
-        selected_indices = set()
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if not item:
-                continue
-            btn = item.widget()
-            if btn and btn in self.selected_buttons:
-                selected_indices.add(i)
-        return selected_indices
+    def _store_selected_names(self, grid_info):
+        """Store preset names of selected buttons in this grid before updating"""
+        return {
+            btn.preset.name()
+            for btn in self.selected_buttons
+            if getattr(btn, 'grid_info', None) is grid_info
+        }
 
     def _clear_grid_buttons(self, layout):
         """Clear all buttons from the grid layout"""
@@ -73,7 +67,6 @@ class GridUpdateMixin:
                 self.selected_buttons.remove(widget)
             layout.removeWidget(widget)
             widget.hide()
-            widget.setParent(None)
             widget.deleteLater()
 
     def _clear_last_selected_if_in_grid(self, grid_info):
@@ -85,36 +78,25 @@ class GridUpdateMixin:
         if self.last_selected_button.grid_info == grid_info:
             self.last_selected_button = None
 
-    def _calculate_max_name_lines_for_grid(self, presets):
+    def _calculate_max_name_lines_for_grid(self, preset_names):
         """Calculate the maximum number of lines needed for brush names in a grid.
         
         Args:
-            presets: List of brush presets in the grid
+            preset_names: List of brush preset names in the grid
             
         Returns:
             1 or 2 based on the longest name in the grid
         """
-        if not get_display_brush_names() or not presets:
+        if not get_display_brush_names() or not preset_names:
             return 0
         
-        max_lines = 1
-        icon_size = get_brush_icon_size()
+        chars_per_line = get_brush_name_chars_per_line(
+            get_brush_icon_size(), get_brush_name_font_size()
+        )
         
-        # Import here to get font size calculation
-        from ..utils.config_utils import get_brush_name_font_size
-        font_size = get_brush_name_font_size()
-        
-        # Calculate chars per line
-        avg_char_width = font_size * 0.55
-        chars_per_line = max(1, int((icon_size - 4) / avg_char_width))
-        
-        for preset in presets:
-            name_length = len(preset.name())
-            if name_length > chars_per_line:
-                max_lines = 2
-                break  # No need to check further
-        
-        return max_lines
+        # Single C-level reduction over the pre-resolved names
+        max_name_len = max(map(len, preset_names), default=0)
+        return 2 if max_name_len > chars_per_line else 1
 
     def _calculate_grid_height(self, preset_count, columns, name_label_height=0):
         """Calculate required height for grid based on preset count and name labels"""
@@ -124,15 +106,21 @@ class GridUpdateMixin:
         spacing = get_spacing_between_buttons()
         return required_rows * button_height + (required_rows - 1) * spacing + 4
 
-    def _is_preset_selected(self, preset):
-        """Check if preset matches currently selected preset"""
-        if self.current_selected_preset is None:
+    def _is_preset_selected(self, preset_name):
+        """Check if preset name matches the currently selected preset.
+        
+        Compares against ``_current_selected_name``, which update_grid
+        resolves once per call so each button costs a string compare
+        instead of two Qt round-trips.
+        """
+        selected_name = getattr(self, '_current_selected_name', None)
+        if selected_name is None:
             return False
-        return preset.name() == self.current_selected_preset.name()
+        return preset_name == selected_name
 
-    def _restore_button_selection(self, brush_button, index, selected_indices):
-        """Restore selection state for button if it was previously selected"""
-        if index not in selected_indices:
+    def _restore_button_selection(self, brush_button, preset_name, selected_names):
+        """Restore selection state for button if its preset was previously selected"""
+        if preset_name not in selected_names:
             return
         if brush_button in self.selected_buttons:
             return
@@ -140,8 +128,12 @@ class GridUpdateMixin:
         if not self.last_selected_button:
             self.last_selected_button = brush_button
 
-    def _add_preset_button(self, preset, grid_info, layout, columns, index, name_label_height):
-        """Add a single preset button to the grid"""
+    def _add_preset_button(self, preset, preset_name, grid_info, layout, columns, index, name_label_height):
+        """Add a single preset button to the grid.
+        
+        The button is built parent-less and fully configured before
+        addWidget reparents it, so it is polished once in its final state.
+        """
         row = index // columns
         col = index % columns
         brush_button = DraggableBrushButton(preset, grid_info, self)
@@ -151,12 +143,12 @@ class GridUpdateMixin:
         # Set the name label height for consistency across the grid
         brush_button.set_name_label_height(name_label_height)
         
+        is_selected = self._is_preset_selected(preset_name)
+        brush_button.update_highlight(is_selected)
+        
         self.brush_buttons.append(brush_button)
         layout.addWidget(brush_button, row, col)
         
-        is_selected = self._is_preset_selected(preset)
-        brush_button.update_highlight(is_selected)
-        
         return brush_button
     
     def _get_existing_buttons_map(self, layout):
@@ -174,13 +166,12 @@ class GridUpdateMixin:
                     button_map[widget.preset.name()] = widget
         return button_map
     
-    def _reuse_or_create_button(self, preset, grid_info, existing_buttons, columns, index, name_label_height, layout):
+    def _reuse_or_create_button(self, preset, preset_name, grid_info, existing_buttons, columns, index, name_label_height, layout):
         """Reuse an existing button or create a new one.
         
         This optimization avoids expensive widget creation when the preset
         already has a button in the grid.
         """
-        preset_name = preset.name()
         row = index // columns
         col = index % columns
         
@@ -191,6 +182,9 @@ class GridUpdateMixin:
             # Update button properties
             brush_button.grid_index = index + 1
             brush_button.grid_info = grid_info
+            if brush_button.preset is not preset:
+                # Same name, new preset object: show the new one
+                brush_button.update_preset(preset)
             brush_button.set_name_label_height(name_label_height)
             
             # Remove from old position and add to new
@@ -198,7 +192,7 @@ class GridUpdateMixin:
             layout.addWidget(brush_button, row, col)
             
             # Update highlight state
-            is_selected = self._is_preset_selected(preset)
+            is_selected = self._is_preset_selected(preset_name)
             brush_button.update_highlight(is_selected)
             
             # Ensure button is in brush_buttons list
@@ -208,46 +202,85 @@ class GridUpdateMixin:
             return brush_button
         
         # Create new button
-        return self._add_preset_button(preset, grid_info, layout, columns, index, name_label_height)
+        return self._add_preset_button(preset, preset_name, grid_info, layout, columns, index, name_label_height)
 
     def update_grid(self, grid_info):
         """Update grid with current brush presets.
         
         PERFORMANCE: Uses widget reuse to avoid expensive delete/recreate cycles.
         Only creates new buttons for presets that don't have existing buttons.
+        Returns early when the render signature matches the previous call.
         """
         layout = grid_info["layout"]
-        selected_indices = self._store_selected_indices(layout)
-        
-        # Get existing buttons before clearing
-        existing_buttons = self._get_existing_buttons_map(layout)
-        
         columns = self.get_dynamic_columns()
         presets = grid_info["brush_presets"]
         preset_count = len(presets)
         
+        # Resolve names once - preset.name() is a Qt call and is needed
+        # several times per preset below
+        preset_names = [p.name() for p in presets]
+        self._current_selected_name = (
+            self.current_selected_preset.name()
+            if self.current_selected_preset is not None else None
+        )
+        
         # Calculate consistent name label height for all buttons in this grid
-        max_lines = self._calculate_max_name_lines_for_grid(presets)
+        max_lines = self._calculate_max_name_lines_for_grid(preset_names)
         name_label_height = get_brush_name_label_height(max_lines) if max_lines > 0 else 0
         
+        # Nothing observable changed since the last render: only refresh
+        # highlights and visibility instead of walking the layout again.
+        # Preset identity is included so a preset object swapped in under
+        # the same name still rebuilds, as are the name-wrap inputs.
+        icon_size = get_brush_icon_size()
+        font_size = get_brush_name_font_size()
+        render_sig = (
+            columns,
+            tuple(preset_names),
+            tuple(map(id, presets)),
+            name_label_height,
+            icon_size,
+            font_size,
+            get_brush_name_chars_per_line(icon_size, font_size),
+            get_spacing_between_buttons(),
+        )
+        if grid_info.get("_last_render_sig") == render_sig:
+            self.update_selection_highlights()
+            self.update_grid_visibility(grid_info)
+            return
+        
+        selected_names = self._store_selected_names(grid_info)
+        
+        # Get existing buttons before clearing
+        existing_buttons = self._get_existing_buttons_map(layout)
+        
         new_height = self._calculate_grid_height(preset_count, columns, name_label_height)
         grid_info["widget"].setFixedHeight(new_height)
+        # Remember the column count this grid was laid out for
+        grid_info["columns"] = columns
         
         # Clear last selected if it was in this grid
         self._clear_last_selected_if_in_grid(grid_info)
         
-        # Block signals during batch update for better performance
+        # Suspend repaints and layout invalidation during the batch update so
+        # the N addWidget calls collapse into a single activate() pass
         layout_widget = grid_info.get("widget")
         if layout_widget:
             layout_widget.setUpdatesEnabled(False)
+        layout.setEnabled(False)
+        
+        # 1-based grid index -> button, used by keyboard navigation
+        index_map = {}
+        grid_info["_index_map"] = index_map
         
         try:
             # Process presets - reuse buttons where possible
-            for index, preset in enumerate(presets):
+            for index, (preset, preset_name) in enumerate(zip(presets, preset_names)):
                 brush_button = self._reuse_or_create_button(
-                    preset, grid_info, existing_buttons, columns, index, name_label_height, layout
+                    preset, preset_name, grid_info, existing_buttons, columns, index, name_label_height, layout
                 )
-                self._restore_button_selection(brush_button, index, selected_indices)
+                index_map[index + 1] = brush_button
+                self._restore_button_selection(brush_button, preset_name, selected_names)
             
             # Delete buttons that are no longer needed (preset was removed)
             for old_button in existing_buttons.values():
@@ -257,44 +290,48 @@ class GridUpdateMixin:
                     self.selected_buttons.remove(old_button)
                 layout.removeWidget(old_button)
                 old_button.hide()
-                old_button.setParent(None)
                 old_button.deleteLater()
         finally:
-            # Re-enable updates
+            # Re-enable layout first so geometry is settled before repainting
+            layout.setEnabled(True)
+            layout.activate()
             if layout_widget:
                 layout_widget.setUpdatesEnabled(True)
         
+        grid_info["_last_render_sig"] = render_sig
         self.update_selection_highlights()
         self.update_grid_visibility(grid_info)
 
+    def update_grids(self, grid_infos):
+        """Update several grids under one suspended repaint.
+        
+        Each grid is updated once even if listed more than once, and the
+        main widget repaints a single time after the last update.
+        """
+        seen_ids = set()
+        unique = []
+        for grid_info in grid_infos:
+            if id(grid_info) not in seen_ids:
+                seen_ids.add(id(grid_info))
+                unique.append(grid_info)
+        
+        main_widget = getattr(self, 'main_widget', None)
+        if main_widget:
+            main_widget.setUpdatesEnabled(False)
+        try:
+            for grid_info in unique:
+                self.update_grid(grid_info)
+        finally:
+            if main_widget:
+                main_widget.setUpdatesEnabled(True)
+
     def get_button_by_grid_index(self, grid_info, index):
         """Get a brush button by its 1-based grid index within a specific grid."""
-        layout = grid_info.get("layout")
-        if not layout:
-            return None
-        
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if item:
-                btn = item.widget()
-                if btn and hasattr(btn, 'grid_index') and btn.grid_index == index:
-                    return btn
-        return None
+        return grid_info.get("_index_map", {}).get(index)
 
     def get_button_count_in_grid(self, grid_info):
         """Get total count of brush buttons in a grid."""
-        layout = grid_info.get("layout")
-        if not layout:
-            return 0
-        
-        count = 0
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if item:
-                btn = item.widget()
-                if btn and hasattr(btn, 'grid_index'):
-                    count += 1
-        return count
+        return len(grid_info.get("_index_map", {}))
 
     def get_current_button_index_in_active_grid(self):
         """Get the grid_index of the currently selected button in the active grid.
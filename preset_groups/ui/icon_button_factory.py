@@ -9,50 +9,100 @@ from PyQt5.QtWidgets import QPushButton
 from PyQt5.QtCore import Qt, QSize
 from PyQt5.QtGui import QPixmap, QPainter, QColor, QPen, QIcon
 
-from ..utils.styles import docker_btn_style, WindowColors, ButtonColors, OverlayColors, tint_icon_for_theme
+from ..utils.styles import (
+    docker_btn_style,
+    WindowColors,
+    ButtonColors,
+    OverlayColors,
+    get_icon_tint_color,
+    tint_pixmap,
+)
 
 # Path to custom icons in the ui folder
 _UI_DIR = os.path.dirname(__file__)
 
+# Module-level cache of unscaled custom icons keyed by icon name.
+# Misses are stored as None so the disk is only probed once per name.
+_CUSTOM_ICON_CACHE = {}
 
-def _get_icon_button_style():
+# Scaled + tinted icons keyed by (icon_name, icon_size, tint color name).
+# QIcon is implicitly shared, so buttons showing the same icon share pixmaps.
+_TINTED_ICON_CACHE = {}
+
+
+# Dynamic property used by the shared icon button stylesheet
+_ICON_VARIANT_PROPERTY = "iconVariant"
+_PLAIN_ICON_NAMES = ("addbrushicon", "folder", "settings", "deletelayer")
+_PLAIN_SELECTOR = f'QPushButton[{_ICON_VARIANT_PROPERTY}="plain"]'
+_ENHANCED_SELECTOR = f'QPushButton[{_ICON_VARIANT_PROPERTY}="enhanced"]'
+
+
+def _get_icon_button_style(selector="QPushButton"):
     """Generate icon button stylesheet using theme colors."""
     return f"""
-        QPushButton {{
+        {selector} {{
             background-color: {WindowColors.BackgroundNormal};
             border: none;
             border-radius: 2px;
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: {OverlayColors.HoverRgba};
         }}
     """
 
 
-def _get_enhanced_button_style():
+def _get_enhanced_button_style(selector="QPushButton"):
     """Generate enhanced button stylesheet using theme colors."""
     return f"""
-        QPushButton {{
+        {selector} {{
             background-color: {WindowColors.BackgroundNormal};
             border: 1px solid {ButtonColors.BorderNormal};
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: {OverlayColors.HoverRgba};
         }}
     """
 
 
+def get_icon_buttons_stylesheet():
+    """Generate the shared stylesheet for all icon button variants.
+
+    Set once on a parent widget; buttons pick their rules through the
+    iconVariant dynamic property instead of carrying their own stylesheet.
+    """
+    return (
+        _get_icon_button_style(_PLAIN_SELECTOR)
+        + docker_btn_style(_ENHANCED_SELECTOR)
+        + _get_enhanced_button_style(_ENHANCED_SELECTOR)
+    )
+
+
 class IconButtonFactoryMixin:
     """Mixin class providing icon button creation functionality for the docker widget."""
 
+    def apply_icon_buttons_stylesheet(self, widget):
+        """Set the shared icon button stylesheet on a button row container.
+
+        Called once per row at UI setup and again on theme change, instead
+        of parsing a stylesheet per button. Only the row containers are
+        styled so the grids stay out of the stylesheet's scope.
+        """
+        hosts = getattr(self, '_icon_buttons_style_hosts', None)
+        if hosts is None:
+            hosts = self._icon_buttons_style_hosts = []
+        if widget not in hosts:
+            hosts.append(widget)
+        widget.setStyleSheet(get_icon_buttons_stylesheet())
+
     def _apply_button_style(self, button, icon_name):
-        """Apply appropriate style to button based on icon name"""
-        if icon_name in ("addbrushicon", "folder", "settings", "deletelayer"):
-            button.setStyleSheet(_get_icon_button_style())
-        else:
-            base_style = docker_btn_style()
-            enhanced_style = base_style + _get_enhanced_button_style()
-            button.setStyleSheet(enhanced_style)
+        """Select the shared stylesheet variant for a button based on icon name"""
+        variant = "plain" if icon_name in _PLAIN_ICON_NAMES else "enhanced"
+        button.setProperty(_ICON_VARIANT_PROPERTY, variant)
+        # Re-polish only if the button is already styled; new buttons pick
+        # up the property on their first polish.
+        if button.testAttribute(Qt.WA_WState_Polished):
+            button.style().unpolish(button)
+            button.style().polish(button)
 
     def _calculate_button_size(self):
         """Calculate button size based on reference button height"""
@@ -75,49 +125,53 @@ class IconButtonFactoryMixin:
         return base_icon_size
 
     def _load_custom_icon(self, icon_name):
-        """Load a custom PNG icon from the ui folder"""
+        """Load a custom PNG icon from the ui folder (cached per icon name)"""
+        if icon_name in _CUSTOM_ICON_CACHE:
+            return _CUSTOM_ICON_CACHE[icon_name]
+
+        pixmap = None
         icon_path = os.path.join(_UI_DIR, f"{icon_name}.png")
         if os.path.exists(icon_path):
-            pixmap = QPixmap(icon_path)
-            if not pixmap.isNull():
-                return pixmap
-        return None
+            loaded = QPixmap(icon_path)
+            if not loaded.isNull():
+                pixmap = loaded
+        _CUSTOM_ICON_CACHE[icon_name] = pixmap
+        return pixmap
 
     def _load_and_set_icon(self, button, icon_name, button_size, icon_size):
         """Load icon from custom file or Krita and set it on the button.
 
         Icons are automatically tinted to match the theme's font color
         when using a light theme (background > 50% brightness).
+        Scaled/tinted results are cached per icon, size and tint color.
         """
         try:
-            # Try loading custom icon first
-            custom_pixmap = self._load_custom_icon(icon_name)
-            if custom_pixmap:
-                scaled_pixmap = custom_pixmap.scaled(
-                    icon_size,
-                    icon_size,
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation,
-                )
-                # Apply theme-based tinting
-                tinted_pixmap = tint_icon_for_theme(scaled_pixmap)
-                button.setIcon(QIcon(tinted_pixmap))
-                button.setIconSize(QSize(icon_size, icon_size))
-                return
+            tint_color = get_icon_tint_color()
+            theme_key = tint_color.name() if tint_color is not None else ""
+            cache_key = (icon_name, icon_size, theme_key)
 
-            # Fall back to Krita's built-in icons
-            app = Krita.instance()
-            icon = app.icon(icon_name)
-            if not icon or icon.isNull():
-                return
-
-            high_res_size = icon_size * 2
-            pixmap = icon.pixmap(high_res_size, high_res_size)
-            if pixmap.isNull():
-                button.setIcon(icon)
+            cached_icon = _TINTED_ICON_CACHE.get(cache_key)
+            if cached_icon is not None:
+                button.setIcon(cached_icon)
                 button.setIconSize(QSize(icon_size, icon_size))
                 return
 
+            # Try loading custom icon first
+            pixmap = self._load_custom_icon(icon_name)
+            if pixmap is None:
+                # Fall back to Krita's built-in icons
+                app = Krita.instance()
+                icon = app.icon(icon_name)
+                if not icon or icon.isNull():
+                    return
+
+                high_res_size = icon_size * 2
+                pixmap = icon.pixmap(high_res_size, high_res_size)
+                if pixmap.isNull():
+                    button.setIcon(icon)
+                    button.setIconSize(QSize(icon_size, icon_size))
+                    return
+
             scaled_pixmap = pixmap.scaled(
                 icon_size,
                 icon_size,
@@ -125,8 +179,9 @@ class IconButtonFactoryMixin:
                 Qt.SmoothTransformation,
             )
             # Apply theme-based tinting
-            tinted_pixmap = tint_icon_for_theme(scaled_pixmap)
-            button.setIcon(QIcon(tinted_pixmap))
+            tinted_icon = QIcon(tint_pixmap(scaled_pixmap, tint_color))
+            _TINTED_ICON_CACHE[cache_key] = tinted_icon
+            button.setIcon(tinted_icon)
             button.setIconSize(QSize(icon_size, icon_size))
         except Exception as e:
             print(f"Error loading icon '{icon_name}': {e}")
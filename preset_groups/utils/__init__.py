@@ -7,6 +7,7 @@ drag operations, and logging.
 from .config_utils import (
     get_common_config,
     reload_config,
+    invalidate_config_cache,
     get_font_px,
     get_spacing_between_buttons,
     get_spacing_between_grids,
@@ -34,6 +35,7 @@ __all__ = [
     # config_utils
     "get_common_config",
     "reload_config",
+    "invalidate_config_cache",
     "get_font_px",
     "get_spacing_between_buttons",
     "get_spacing_between_grids",
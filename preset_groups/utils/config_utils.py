@@ -3,39 +3,59 @@
 Provides cached access to configuration values with lazy loading.
 """
 
-from .data_manager import check_common_config, invalidate_common_config_cache
+from functools import lru_cache
 
-# Module-level cache for configuration
-_config_cache = None
+from .data_manager import check_common_config, invalidate_common_config_cache
 
 
+@lru_cache(maxsize=1)
 def get_common_config() -> dict:
     """Get common configuration, cached for performance."""
-    global _config_cache
-    if _config_cache is None:
-        _config_cache = check_common_config()
-    return _config_cache
+    return check_common_config()
+
+
+def invalidate_config_cache() -> None:
+    """Drop cached config and per-key lookups without reloading from disk.
+    
+    Call after mutating or saving the config dict so getters see new values.
+    """
+    get_common_config.cache_clear()
+    _get_layout_value.cache_clear()
+    _get_shortcut_value.cache_clear()
+    get_shortcut_button_style_values.cache_clear()
 
 
 def reload_config() -> dict:
     """Clear cache and reload configuration from disk."""
-    global _config_cache
-    _config_cache = None
+    invalidate_config_cache()
     # Also invalidate the data_manager cache
     invalidate_common_config_cache()
     return get_common_config()
 
 
+@lru_cache(maxsize=None)
 def _get_layout_value(key: str, default):
     """Get a value from the layout section of config."""
     return get_common_config().get("layout", {}).get(key, default)
 
 
+@lru_cache(maxsize=None)
 def _get_shortcut_value(key: str, default):
     """Get a value from the shortcut section of config."""
     return get_common_config().get("shortcut", {}).get(key, default)
 
 
+@lru_cache(maxsize=1)
+def get_shortcut_button_style_values() -> tuple:
+    """Get (background color, font color, font size) for shortcut buttons."""
+    config = get_common_config()
+    return (
+        config["color"]["shortcut_button_background_color"],
+        config["color"]["shortcut_button_font_color"],
+        config["font"]["shortcut_button_font_size"],
+    )
+
+
 def get_spacing_between_buttons() -> int:
     """Get spacing between buttons from config."""
     return _get_layout_value("spacing_between_buttons", 1)
@@ -128,13 +148,15 @@ def get_brush_name_font_size() -> int:
     Returns the temporary preview size if set, otherwise the configured value.
     The value is clamped between min and max thresholds.
     """
-    global _temp_brush_name_font_size
-    if _temp_brush_name_font_size is not None:
-        size = _temp_brush_name_font_size
-    else:
-        size = get_brush_name_font_size_config()
-    # Clamp between min and max
-    return max(_BRUSH_NAME_MIN_FONT_SIZE, min(_BRUSH_NAME_MAX_FONT_SIZE, size))
+    size = _temp_brush_name_font_size
+    if size is None:
+        size = _get_layout_value("brush_name_font_size", _BRUSH_NAME_DEFAULT_FONT_SIZE)
+    # Clamp between min and max (inline compares, no min()/max() calls)
+    if size < _BRUSH_NAME_MIN_FONT_SIZE:
+        return _BRUSH_NAME_MIN_FONT_SIZE
+    if size > _BRUSH_NAME_MAX_FONT_SIZE:
+        return _BRUSH_NAME_MAX_FONT_SIZE
+    return size
 
 
 def get_brush_name_label_height(lines: int = 1) -> int:
@@ -146,12 +168,28 @@ def get_brush_name_label_height(lines: int = 1) -> int:
     Returns:
         Height in pixels for the name label area
     """
-    font_size = get_brush_name_font_size()
+    return _brush_name_label_height(get_brush_name_font_size(), lines)
+
+
+@lru_cache(maxsize=None)
+def _brush_name_label_height(font_size: int, lines: int) -> int:
+    """Label height for an explicit font size (memoized; font size is the key)."""
     line_height = int(font_size * 1.3)  # Line height multiplier
     padding = 4  # Top + bottom padding
     return (line_height * lines) + padding
 
 
+@lru_cache(maxsize=None)
+def get_brush_name_chars_per_line(icon_size: int, font_size: int) -> int:
+    """Approximate characters that fit on one brush name line (memoized).
+    
+    Average character width is roughly 0.55 * font_size for sans-serif;
+    4px is reserved for label padding.
+    """
+    avg_char_width = font_size * 0.55
+    return max(1, int((icon_size - 4) / avg_char_width))
+
+
 # Group name font sizing constants
 _GROUP_NAME_MIN_FONT_SIZE = 8
 _GROUP_NAME_MAX_FONT_SIZE = 24
@@ -195,13 +233,15 @@ def get_group_name_font_size() -> int:
     Returns the temporary preview size if set, otherwise the configured value.
     The value is clamped between min and max thresholds.
     """
-    global _temp_group_name_font_size
-    if _temp_group_name_font_size is not None:
-        size = _temp_group_name_font_size
-    else:
-        size = get_group_name_font_size_config()
-    # Clamp between min and max
-    return max(_GROUP_NAME_MIN_FONT_SIZE, min(_GROUP_NAME_MAX_FONT_SIZE, size))
+    size = _temp_group_name_font_size
+    if size is None:
+        size = _get_layout_value("group_name_font_size", _GROUP_NAME_DEFAULT_FONT_SIZE)
+    # Clamp between min and max (inline compares, no min()/max() calls)
+    if size < _GROUP_NAME_MIN_FONT_SIZE:
+        return _GROUP_NAME_MIN_FONT_SIZE
+    if size > _GROUP_NAME_MAX_FONT_SIZE:
+        return _GROUP_NAME_MAX_FONT_SIZE
+    return size
 
 
 def get_group_name_padding() -> int:
@@ -234,8 +274,12 @@ def get_collapse_button_size(name_button_height: int) -> tuple:
     Returns:
         Tuple of (width, height) in pixels for the collapse button.
     """
-    font_size = get_group_name_font_size()
-    
+    return _collapse_button_size(get_group_name_font_size(), name_button_height)
+
+
+@lru_cache(maxsize=None)
+def _collapse_button_size(font_size: int, name_button_height: int) -> tuple:
+    """Collapse button size for an explicit font size (memoized; font size is the key)."""
     if font_size >= _GROUP_NAME_DEFAULT_FONT_SIZE:
         # Font size >= 12: height scales with name button, width stays at base
         # Calculate what the base width would be at font size 12
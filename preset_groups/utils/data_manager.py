@@ -5,8 +5,28 @@ Handles loading/saving of grid data and common configuration files.
 
 import os
 import json
+from operator import methodcaller
 from typing import Any
 
+# orjson is optional; Krita's bundled Python usually lacks it, so fall back
+# to the stdlib json module with equivalent output.
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    orjson = None
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
 # Path constants
 _UTILS_DIR = os.path.dirname(__file__)
 _CONFIG_DIR = os.path.join(_UTILS_DIR, "..", "config")
@@ -47,21 +67,32 @@ DEFAULT_CONFIG = {
 def _read_json(path: str, default: Any = None) -> Any:
     """Safely read a JSON file, returning default on error."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open(path, "rb") as f:
+            return _loads(f.read())
+    except (FileNotFoundError, ValueError):
         return default
 
 
 def _write_json(path: str, data: Any) -> bool:
-    """Safely write data to a JSON file."""
+    """Safely write data to a JSON file.
+    
+    Writes to a temporary file and swaps it in with os.replace, so a crash
+    mid-write leaves the previous file intact instead of a truncated one.
+    """
+    tmp_path = path + ".tmp"
     try:
+        payload = _dumps(data)
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
         return True
     except Exception as e:
         print(f"Error writing JSON to {path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return False
 
 
@@ -78,9 +109,9 @@ def save_common_config(config: dict) -> bool:
     result = _write_json(_CONFIG_PATH, config)
     # Invalidate the config cache after saving
     try:
-        from . import config_utils
-        config_utils._config_cache = None
-    except (ImportError, AttributeError):
+        from .config_utils import invalidate_config_cache
+        invalidate_config_cache()
+    except ImportError:
         pass
     return result
 
@@ -145,16 +176,28 @@ def load_grids_data(data_file: str, preset_dict: dict) -> tuple[list, int]:
     if not data:
         return [], 0
 
+    grids_data = data.get("grids", [])
+    
+    # Resolve every referenced name against the (large) preset dict once;
+    # grids then look names up in this much smaller mapping
+    all_names = {
+        name
+        for grid_data in grids_data
+        for name in grid_data.get("brush_presets", [])
+    }
+    resolved = {name: preset_dict[name] for name in all_names & preset_dict.keys()}
+    
     grids = []
-    for idx, grid_data in enumerate(data.get("grids", []), start=1):
+    get_preset = resolved.get
+    for idx, grid_data in enumerate(grids_data, start=1):
         grid_name = grid_data.get("name", f"Group {idx}")
         brush_names = grid_data.get("brush_presets", [])
         
-        # Resolve preset names to actual preset objects
+        # Resolve preset names to actual preset objects (one hash per name)
         brush_presets = [
-            preset_dict[name]
-            for name in brush_names
-            if name in preset_dict
+            preset
+            for preset in map(get_preset, brush_names)
+            if preset is not None
         ]
         
         grid_info = _create_empty_grid_info(grid_name)
@@ -164,15 +207,18 @@ def load_grids_data(data_file: str, preset_dict: dict) -> tuple[list, int]:
     return grids, len(grids)
 
 
+_preset_name = methodcaller("name")
+
+
+def _serialize_grid(grid: dict) -> dict:
+    """Convert a grid info dict to its saved form (name + preset names)."""
+    return {
+        "name": grid["name"],
+        "brush_presets": list(map(_preset_name, grid["brush_presets"])),
+    }
+
+
 def save_grids_data(data_file: str, grids: list) -> bool:
     """Save grids data to file."""
-    data = {
-        "grids": [
-            {
-                "name": grid["name"],
-                "brush_presets": [p.name() for p in grid["brush_presets"]],
-            }
-            for grid in grids
-        ]
-    }
+    data = {"grids": list(map(_serialize_grid, grids))}
     return _write_json(data_file, data)
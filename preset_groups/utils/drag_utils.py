@@ -4,65 +4,109 @@ We currently use simple, name-based payloads to stay compatible with existing
 behavior:
   - Single brush:  "brush_preset:<name>"
   - Multi brush:   "brush_presets_multi:<name1,name2,...>"
-  - Single grid:   "grid:<name>"
-  - Multi grid:    "grids_multi:<name1,name2,...>"
+  - Single grid:   "grid_drag:<name>"
+  - Multi grid:    "grids_drag_multi:<name1,name2,...>"
 
 If we ever need richer payloads again (e.g., per-instance IDs), we can extend
 these helpers in one place without touching widget code.
 """
 
+import sys
+from functools import lru_cache
+
+_SINGLE_PREFIX = "brush_preset:"
+_MULTI_PREFIX = "brush_presets_multi:"
+_GRID_SINGLE_PREFIX = "grid_drag:"
+_GRID_MULTI_PREFIX = "grids_drag_multi:"
+_GRID_PREFIXES = (_GRID_SINGLE_PREFIX, _GRID_MULTI_PREFIX)
+_BRUSH_PREFIXES = (_SINGLE_PREFIX, _MULTI_PREFIX)
+
+# Empty marker format set alongside the text payload of grid drags, so drag
+# move handlers can test for a grid drag without converting the text
+GRID_DRAG_MIME_TYPE = "application/x-preset-groups-grid"
+
+
+def _strip_prefix(text: str, prefix: str):
+    """Return text without prefix, or None if it doesn't start with it.
+
+    Prefixes are non-empty, so an unchanged length means no match.
+    """
+    rest = text.removeprefix(prefix)
+    return None if len(rest) == len(text) else rest
+
+
+@lru_cache(maxsize=32)
+def _split_names(payload: str) -> tuple:
+    """Split a comma-separated name list (cached; drag events repeat payloads).
+
+    Names are interned so comparisons against preset names can short-circuit
+    on identity.
+    """
+    return tuple(
+        sys.intern(name)
+        for name in map(str.strip, payload.split(","))
+        if name
+    )
+
+
 def encode_single(preset_name: str) -> str:
     """Encode a single preset name into the drag text payload."""
-    return f"brush_preset:{preset_name}"
+    return f"{_SINGLE_PREFIX}{preset_name}"
 
 
 def encode_multi(preset_names) -> str:
     """Encode multiple preset names (in order) into the drag text payload."""
     names = [name for name in preset_names if name]
-    return "brush_presets_multi:" + ",".join(names)
+    return _MULTI_PREFIX + ",".join(names)
 
 
 def decode_single(text: str):
     """Decode a single preset payload, returning the preset name or None."""
-    if not text.startswith("brush_preset:"):
-        return None
-    return text.split(":", 1)[1]
+    return _strip_prefix(text, _SINGLE_PREFIX)
 
 
 def decode_multi(text: str):
     """Decode a multi-preset payload, returning a list of preset names."""
-    if not text.startswith("brush_presets_multi:"):
+    payload = _strip_prefix(text, _MULTI_PREFIX)
+    if payload is None:
         return []
-    payload = text.split(":", 1)[1]
-    return [name.strip() for name in payload.split(",") if name.strip()]
+    return list(_split_names(payload))
 
 
 def encode_grid_single(grid_name: str) -> str:
     """Encode a single grid name into the drag text payload."""
-    return f"grid_drag:{grid_name}"
+    return f"{_GRID_SINGLE_PREFIX}{grid_name}"
 
 
 def encode_grid_multi(grid_names) -> str:
     """Encode multiple grid names (in order) into the drag text payload."""
     names = [name for name in grid_names if name]
-    return "grids_drag_multi:" + ",".join(names)
+    return _GRID_MULTI_PREFIX + ",".join(names)
 
 
 def decode_grid_single(text: str):
     """Decode a single grid payload, returning the grid name or None."""
-    if not text.startswith("grid_drag:"):
-        return None
-    return text.split(":", 1)[1]
+    return _strip_prefix(text, _GRID_SINGLE_PREFIX)
 
 
 def decode_grid_multi(text: str):
     """Decode a multi-grid payload, returning a list of grid names."""
-    if not text.startswith("grids_drag_multi:"):
+    payload = _strip_prefix(text, _GRID_MULTI_PREFIX)
+    if payload is None:
         return []
-    payload = text.split(":", 1)[1]
-    return [name.strip() for name in payload.split(",") if name.strip()]
+    return list(_split_names(payload))
 
 
+def is_brush_drag(text: str) -> bool:
+    """Check if the drag payload carries one or more brush presets."""
+    return text.startswith(_BRUSH_PREFIXES)
+
+
 def is_grid_drag(text: str) -> bool:
     """Check if the drag payload is a grid drag operation."""
-    return text.startswith("grid_drag:") or text.startswith("grids_drag_multi:")
\ No newline at end of file
+    return text.startswith(_GRID_PREFIXES)
+
+
+def is_grid_drag_mime(mime_data) -> bool:
+    """Check a QMimeData for the grid drag marker format (no text decoding)."""
+    return mime_data.hasFormat(GRID_DRAG_MIME_TYPE)
\ No newline at end of file
@@ -11,14 +11,21 @@ _LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
 _LOG_FILE = os.path.join(_LOG_DIR, "log.txt")
 
 
-def write_log(message: str) -> None:
-    """Write a debug message to the log file (no-op if debugging disabled)."""
-    if not _DEBUG_ENABLED:
-        return
-    
+def _write_log_to_file(message: str) -> None:
+    """Append a debug message to the log file."""
     try:
         os.makedirs(_LOG_DIR, exist_ok=True)
         with open(_LOG_FILE, "a", encoding="utf-8") as f:
             f.write(message + "\n")
     except OSError:
         pass
+
+
+def _write_log_disabled(message: str) -> None:
+    """Discard the message; debugging is disabled."""
+
+
+# Bound once at import so disabled logging costs no flag check per call.
+# Callers should still avoid building expensive messages unless
+# _DEBUG_ENABLED is set, since arguments are evaluated either way.
+write_log = _write_log_to_file if _DEBUG_ENABLED else _write_log_disabled
@@ -10,11 +10,25 @@ Color Mappings from Krita .colors files to QPalette:
 - Colors:Selection → QPalette.Highlight, QPalette.HighlightedText
 """
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor, QPalette, QPainter, QPixmap
+import sys
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from types import MappingProxyType
+
+from PyQt5.QtGui import QColor, QImage, QPalette, QPainter, QPixmap
 from PyQt5.QtWidgets import QApplication
 
-from .config_utils import get_common_config
+from .config_utils import get_shortcut_button_style_values
+
+# NumPy is optional; not every Krita build bundles it, so tinting falls back
+# to the QPainter composition path without it.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# ARGB32 pixels are stored as B, G, R, A bytes on little-endian hosts only
+_NUMPY_TINT = np is not None and sys.byteorder == "little"
 
 
 # =============================================================================
@@ -26,31 +40,82 @@ def get_palette() -> QPalette:
     return app.palette() if app else QPalette()
 
 
+def _palette_memoized(func):
+    """Memoize a zero-argument theme helper until the palette changes.
+
+    The result is recomputed only when the application palette's cacheKey()
+    differs from the one it was computed for. Returned QColors are shared;
+    copy before mutating.
+    """
+    state = [None, None]  # [palette cacheKey, result]
+
+    @wraps(func)
+    def wrapper():
+        key = get_palette().cacheKey()
+        if state[0] != key:
+            state[1] = func()
+            state[0] = key
+        return state[1]
+
+    return wrapper
+
+
+# Palette entries (QColor, hex name) keyed by (role, group), valid for the
+# palette whose cacheKey() is _PALETTE_KEY. A theme change installs a new
+# palette with a new key, which clears the cache on the next lookup.
+_PALETTE_CACHE = {}
+_PALETTE_KEY = None
+
+
+def _palette_entry(role, group):
+    """Return the cached (QColor, hex name) pair for a palette role."""
+    global _PALETTE_KEY
+    pal = get_palette()
+    key = pal.cacheKey()
+    if key != _PALETTE_KEY:
+        _PALETTE_CACHE.clear()
+        _PALETTE_KEY = key
+    cache_key = (role, group)
+    entry = _PALETTE_CACHE.get(cache_key)
+    if entry is None:
+        color = pal.color(group, role)
+        entry = _PALETTE_CACHE[cache_key] = (color, color.name())
+    return entry
+
+
 def palette_color(role: QPalette.ColorRole, group: QPalette.ColorGroup = QPalette.Normal) -> QColor:
-    """Get a QColor from the palette for the given role and group."""
-    return get_palette().color(group, role)
+    """Get a QColor from the palette for the given role and group.
+
+    The returned QColor is shared through the palette cache; copy it with
+    QColor(color) before mutating.
+    """
+    return _palette_entry(role, group)[0]
 
 
 def palette_color_name(role: QPalette.ColorRole, group: QPalette.ColorGroup = QPalette.Normal) -> str:
     """Get a hex color string from the palette for the given role and group."""
-    return palette_color(role, group).name()
+    return _palette_entry(role, group)[1]
 
 
+@_palette_memoized
 def is_dark_theme() -> bool:
     """Check if the current theme is dark based on window background lightness."""
     return palette_color(QPalette.Window).lightness() < 128
 
 
+@_palette_memoized
 def get_background_lightness() -> int:
     """Get the lightness value (0-255) of the theme's background color."""
     return palette_color(QPalette.Window).lightness()
 
 
+@_palette_memoized
 def is_light_theme() -> bool:
     """Check if the current theme is light (background > 50% brightness)."""
     return get_background_lightness() >= 128
 
 
+@_palette_memoized
 def get_icon_tint_color() -> QColor:
     """Get the color to use for tinting icons in light themes.
 
@@ -74,16 +139,13 @@ def tint_pixmap(pixmap: QPixmap, tint_color: QColor) -> QPixmap:
     if pixmap.isNull() or tint_color is None:
         return pixmap
 
-    # Create a copy to avoid modifying the original
-    result = QPixmap(pixmap.size())
-    result.fill(Qt.transparent)
+    if _NUMPY_TINT:
+        return _tint_pixmap_numpy(pixmap, tint_color)
 
-    painter = QPainter(result)
-    painter.setCompositionMode(QPainter.CompositionMode_Source)
-
-    # Draw the original pixmap
-    painter.drawPixmap(0, 0, pixmap)
+    # Implicitly shared copy; detaches from the original when painted on
+    result = QPixmap(pixmap)
 
+    painter = QPainter(result)
     # Apply tint using SourceIn composition (preserves alpha from destination)
     painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
     painter.fillRect(result.rect(), tint_color)
@@ -92,14 +154,51 @@ def tint_pixmap(pixmap: QPixmap, tint_color: QColor) -> QPixmap:
     return result
 
 
-def tint_icon_for_theme(pixmap):
+def _tint_pixmap_numpy(pixmap: QPixmap, tint_color: QColor) -> QPixmap:
+    """Single-pass equivalent of the SourceIn tint on the raw image buffer.
+
+    Works on premultiplied ARGB32, so each pixel becomes tint * alpha / 255
+    with integer math only.
+    """
+    image = pixmap.toImage().convertToFormat(QImage.Format_ARGB32_Premultiplied)
+    ptr = image.bits()
+    ptr.setsize(image.byteCount())
+    pixels = np.frombuffer(ptr, dtype=np.uint8).reshape(
+        image.height(), image.bytesPerLine() // 4, 4
+    )
+
+    alpha = pixels[..., 3].astype(np.uint16)
+    if tint_color.alpha() != 255:
+        alpha = alpha * tint_color.alpha() // 255
+    tint_bgr = np.array(
+        [tint_color.blue(), tint_color.green(), tint_color.red()], dtype=np.uint16
+    )
+    pixels[..., :3] = (tint_bgr * alpha[..., None] // 255).astype(np.uint8)
+    pixels[..., 3] = alpha.astype(np.uint8)
+
+    return QPixmap.fromImage(image)
+
+
+# Tinted pixmaps keyed by (caller cache key, tint rgba), valid for the
+# palette whose cacheKey() is _ICON_TINT_KEY. Least recently used entries are
+# evicted past _ICON_TINT_CACHE_SIZE; QPixmap is implicitly shared.
+_ICON_TINT_CACHE = OrderedDict()
+_ICON_TINT_CACHE_SIZE = 256
+_ICON_TINT_KEY = None
+
+
+def tint_icon_for_theme(pixmap, cache_key=None):
     """Tint an icon pixmap based on current theme.
 
     For light themes (background > 50% brightness), tints the icon to match
-    the theme's font color for better visibility.
+    the theme's font color for better visibility. When cache_key is given,
+    tinted results are cached under it, so re-tinting the same icon is a
+    lookup.
 
     Args:
         pixmap: The QPixmap to potentially tint
+        cache_key: Optional hashable identifying the source icon, e.g.
+            (icon name, size). Without it the pixmap is tinted uncached.
 
     Returns:
         The original pixmap for dark themes, or a tinted pixmap for light themes
@@ -107,18 +206,26 @@ def tint_icon_for_theme(pixmap):
     tint_color = get_icon_tint_color()
     if tint_color is None:
         return pixmap
-    return tint_pixmap(pixmap, tint_color)
 
+    if cache_key is None:
+        return tint_pixmap(pixmap, tint_color)
 
-def color_similarity(color1: QColor, color2: QColor) -> float:
-    """Calculate the similarity between two colors as a percentage (0-100).
+    global _ICON_TINT_KEY
+    palette_key = get_palette().cacheKey()
+    if palette_key != _ICON_TINT_KEY:
+        _ICON_TINT_CACHE.clear()
+        _ICON_TINT_KEY = palette_key
 
-    Uses lightness difference as the primary metric since contrast is about
-    distinguishing elements visually.
-    """
-    lightness_diff = abs(color1.lightness() - color2.lightness())
-    # Convert to percentage (255 is max lightness difference)
-    return 100 - (lightness_diff / 255 * 100)
+    key = (cache_key, tint_color.rgba())
+    tinted = _ICON_TINT_CACHE.get(key)
+    if tinted is not None:
+        _ICON_TINT_CACHE.move_to_end(key)
+        return tinted
+
+    tinted = _ICON_TINT_CACHE[key] = tint_pixmap(pixmap, tint_color)
+    if len(_ICON_TINT_CACHE) > _ICON_TINT_CACHE_SIZE:
+        _ICON_TINT_CACHE.popitem(last=False)
+    return tinted
 
 
 def ensure_contrast(color: QColor, background: QColor, min_contrast_percent: float = 10) -> QColor:
@@ -134,17 +241,16 @@ def ensure_contrast(color: QColor, background: QColor, min_contrast_percent: flo
     Returns:
         The original color if contrast is sufficient, otherwise an adjusted color
     """
-    similarity = color_similarity(color, background)
+    bg_lightness = background.lightness()
+    delta = abs(color.lightness() - bg_lightness)
 
-    if similarity <= (100 - min_contrast_percent):
+    # Integer form of "similarity <= 100 - percent" (255 is max lightness difference)
+    if delta * 100 >= 255 * min_contrast_percent:
         # Contrast is sufficient
         return color
 
-    # Need to adjust - determine direction based on theme
-    bg_lightness = background.lightness()
-
-    # Calculate the minimum lightness difference needed
-    min_lightness_diff = int(255 * min_contrast_percent / 100) + 1
+    # Minimum lightness difference needed to land just past the threshold
+    min_lightness_diff = int(255 * min_contrast_percent // 100) + 1
 
     if is_dark_theme():
         # Dark theme: make the color lighter (brighter)
@@ -159,6 +265,7 @@ def ensure_contrast(color: QColor, background: QColor, min_contrast_percent: flo
     result.setHsl(h, s, target_lightness, a)
     return result
     
+@_palette_memoized
 def get_vibrant_highlight() -> QColor:
     """Get the highlight color, specifically boosted for dark themes.
     
@@ -188,42 +295,38 @@ def get_vibrant_highlight() -> QColor:
 # =============================================================================
 # Utility Functions
 # =============================================================================
+@lru_cache(maxsize=128)
 def lighten_color(hex_color: str, amount: int) -> str:
-    """Lighten a hex color by adjusting its HSV value."""
-    try:
-        color = QColor(hex_color)
-        h, s, v, a = color.getHsv()
-        color.setHsv(h, s, min(255, v + amount), a)
-        return color.name()
-    except Exception:
+    """Lighten a hex color by adjusting its HSV value (memoized)."""
+    color = QColor(hex_color)
+    if not color.isValid():
         return hex_color
+    h, s, v, a = color.getHsv()
+    color.setHsv(h, s, min(255, v + amount), a)
+    return color.name()
 
 
+@lru_cache(maxsize=128)
 def darken_color(hex_color: str, amount: int) -> str:
-    """Darken a hex color by adjusting its HSV value."""
-    try:
-        color = QColor(hex_color)
-        h, s, v, a = color.getHsv()
-        color.setHsv(h, s, max(0, v - amount), a)
-        return color.name()
-    except Exception:
+    """Darken a hex color by adjusting its HSV value (memoized)."""
+    color = QColor(hex_color)
+    if not color.isValid():
         return hex_color
+    h, s, v, a = color.getHsv()
+    color.setHsv(h, s, max(0, v - amount), a)
+    return color.name()
 
 
 def lighten_qcolor(color: QColor, amount: int) -> QColor:
     """Lighten a QColor by adjusting its HSV value."""
     h, s, v, a = color.getHsv()
-    result = QColor()
-    result.setHsv(h, s, min(255, v + amount), a)
-    return result
+    return QColor.fromHsv(h, s, min(255, v + amount), a)
 
 
 def darken_qcolor(color: QColor, amount: int) -> QColor:
     """Darken a QColor by adjusting its HSV value."""
     h, s, v, a = color.getHsv()
-    result = QColor()
-    result.setHsv(h, s, max(0, v - amount), a)
-    return result
+    return QColor.fromHsv(h, s, max(0, v - amount), a)
 
 
 def adjust_color(hex_color: str, amount: int) -> str:
@@ -242,6 +345,8 @@ def adjust_qcolor(color: QColor, amount: int) -> QColor:
 
 def blend_colors(color1: QColor, color2: QColor, ratio: float = 0.5) -> QColor:
     """Blend two colors together. ratio=0 returns color1, ratio=1 returns color2."""
+    if ratio == 0.5:
+        return _midpoint_color(color1, color2)
     r = int(color1.red() + (color2.red() - color1.red()) * ratio)
     g = int(color1.green() + (color2.green() - color1.green()) * ratio)
     b = int(color1.blue() + (color2.blue() - color1.blue()) * ratio)
@@ -249,13 +354,25 @@ def blend_colors(color1: QColor, color2: QColor, ratio: float = 0.5) -> QColor:
     return QColor(r, g, b, a)
 
 
+def _midpoint_color(color1: QColor, color2: QColor) -> QColor:
+    """Integer midpoint of two colors (same result as blend_colors at 0.5)."""
+    return QColor(
+        (color1.red() + color2.red()) >> 1,
+        (color1.green() + color2.green()) >> 1,
+        (color1.blue() + color2.blue()) >> 1,
+        (color1.alpha() + color2.alpha()) >> 1,
+    )
+
+
+@_palette_memoized
 def get_mid_color() -> QColor:
     """Get a color between Button and Window backgrounds (for borders/separators)."""
     button_bg = palette_color(QPalette.Button)
     window_bg = palette_color(QPalette.Window)
-    return blend_colors(button_bg, window_bg, 0.5)
+    return _midpoint_color(button_bg, window_bg)
 
 
+@_palette_memoized
 def get_contrast_border() -> QColor:
     """Get a border color with good contrast against button backgrounds."""
     button_bg = palette_color(QPalette.Button)
@@ -264,28 +381,42 @@ def get_contrast_border() -> QColor:
     return darken_qcolor(button_bg, 30)
 
 
+@_palette_memoized
+def get_toggle_on_color() -> QColor:
+    """Get the toggle ON background: vibrant highlight tinted toward green."""
+    # Use vibrant highlight for the base so the green tint isn't muddy in dark themes
+    green_tint = QColor(74, 124, 89)  # Muted green that works in both themes
+    return blend_colors(get_vibrant_highlight(), green_tint, 0.7)
+
+
 # =============================================================================
 # Metaclass for Dynamic Color Classes
 # Allows accessing color methods as class attributes: WindowColors.BackgroundNormal
 # =============================================================================
 class _DynamicColorMeta(type):
-    """Metaclass that redirects attribute access to getter methods."""
-
-    def __getattribute__(cls, name):
-        # First try to get from class dict directly (for methods, FontSize, etc.)
-        try:
-            value = super().__getattribute__(name)
-            # If it's a _ColorProperty, call it
-            if isinstance(value, _ColorProperty):
-                return value.getter()
-            return value
-        except AttributeError:
-            pass
-        # Convert attribute name to getter method name
-        getter_name = f"_get_{name.lower()}"
-        if hasattr(cls, getter_name):
-            return getattr(cls, getter_name)()
-        raise AttributeError(f"'{cls.__name__}' has no attribute '{name}'")
+    """Metaclass that redirects attribute access to getter methods.
+
+    Getters are collected once at class creation, keyed by lowercased name.
+    The first access to e.g. ``BackgroundNormal`` misses the class dict and
+    installs a _ColorProperty under that exact name, so later accesses take
+    the normal attribute lookup path like ``FontSize`` does.
+    """
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls._color_getters = MappingProxyType({
+            key[len("_get_"):]: value.__func__
+            for key, value in namespace.items()
+            if key.startswith("_get_") and isinstance(value, staticmethod)
+        })
+
+    def __getattr__(cls, name):
+        # Only reached when normal lookup fails: map the name to its getter
+        getter = cls._color_getters.get(name.lower())
+        if getter is None:
+            raise AttributeError(f"'{cls.__name__}' has no attribute '{name}'")
+        setattr(cls, name, _ColorProperty(getter))
+        return getter()
 
 
 class _ColorProperty:
@@ -380,15 +511,15 @@ class ButtonColors(metaclass=_DynamicColorMeta):
     @staticmethod
     def _get_borderhover() -> str:
         """Hover border color - more prominent."""
-        return adjust_color(get_contrast_border().name(), 25)
+        return adjust_qcolor(get_contrast_border(), 25).name()
 
     @staticmethod
     def _get_borderpressed() -> str:
         """Pressed border color - subtle."""
-        border = get_contrast_border().name()
+        border = get_contrast_border()
         if is_dark_theme():
-            return darken_color(border, 20)
-        return lighten_color(border, 20)
+            return darken_qcolor(border, 20).name()
+        return lighten_qcolor(border, 20).name()
 
 
 # =============================================================================
@@ -425,12 +556,12 @@ class PrimaryButtonColors(metaclass=_DynamicColorMeta):
     def _get_backgroundhover() -> str:
         """Primary button hover - lighter version of vibrant highlight."""
         # Must use get_vibrant_highlight as base, otherwise hover might look duller than normal
-        return lighten_color(get_vibrant_highlight().name(), 15)
+        return lighten_qcolor(get_vibrant_highlight(), 15).name()
 
     @staticmethod
     def _get_backgroundpressed() -> str:
         """Primary button pressed - darker version of vibrant highlight."""
-        return darken_color(get_vibrant_highlight().name(), 15)
+        return darken_qcolor(get_vibrant_highlight(), 15).name()
 
     @staticmethod
     def _get_foregroundnormal() -> str:
@@ -448,15 +579,12 @@ class ToggleColors(metaclass=_DynamicColorMeta):
     @staticmethod
     def _get_onbackgroundnormal() -> str:
         """Toggle ON background - green tinted from highlight base."""
-        # Use vibrant highlight for the base so the green tint isn't muddy in dark themes
-        highlight = get_vibrant_highlight()
-        green_tint = QColor(74, 124, 89)  # Muted green that works in both themes
-        return blend_colors(highlight, green_tint, 0.7).name()
+        return get_toggle_on_color().name()
 
     @staticmethod
     def _get_onbackgroundhover() -> str:
         """Toggle ON hover - lighter green."""
-        return lighten_color(ToggleColors.OnBackgroundNormal, 15)
+        return lighten_qcolor(get_toggle_on_color(), 15).name()
 
     @staticmethod
     def _get_offbackgroundnormal() -> str:
@@ -497,7 +625,7 @@ class SelectionColors(metaclass=_DynamicColorMeta):
     @staticmethod
     def _get_hoveroverlayqcolor() -> QColor:
         """Semi-transparent hover overlay."""
-        base = palette_color(QPalette.Shadow)
+        base = QColor(palette_color(QPalette.Shadow))
         base.setAlpha(70)
         return base
 
@@ -579,12 +707,14 @@ class DragColors(metaclass=_DynamicColorMeta):
 # =============================================================================
 class OverlayColors(metaclass=_DynamicColorMeta):
     @staticmethod
+    @_palette_memoized
     def _get_hoverrgba() -> str:
         """Semi-transparent hover overlay."""
         shadow = palette_color(QPalette.Shadow)
         return f"rgba({shadow.red()}, {shadow.green()}, {shadow.blue()}, 0.3)"
 
     @staticmethod
+    @_palette_memoized
     def _get_pressedrgba() -> str:
         """Semi-transparent pressed overlay."""
         shadow = palette_color(QPalette.Shadow)
@@ -605,40 +735,59 @@ class SeparatorColors(metaclass=_DynamicColorMeta):
 # [Colors:Slider] - Slider control colors
 # Ensures slider elements have at least 10% contrast with background
 # =============================================================================
+@_palette_memoized
+def _slider_colors() -> tuple:
+    """Compute (groove, page, handle) slider colors against one background read."""
+    bg_color = palette_color(QPalette.Window)
+    handle_role = QPalette.Light if is_dark_theme() else QPalette.Dark
+    return tuple(
+        ensure_contrast(palette_color(role), bg_color, min_contrast_percent=10).name()
+        for role in (QPalette.Mid, QPalette.Midlight, handle_role)
+    )
+
+
 class SliderColors(metaclass=_DynamicColorMeta):
     @staticmethod
     def _get_groovebackground() -> str:
         """Slider groove background with guaranteed contrast."""
-        groove_color = palette_color(QPalette.Mid)
-        bg_color = palette_color(QPalette.Window)
-        adjusted = ensure_contrast(groove_color, bg_color, min_contrast_percent=10)
-        return adjusted.name()
+        return _slider_colors()[0]
 
     @staticmethod
     def _get_pagebackground() -> str:
         """Slider page (filled portion) background with guaranteed contrast."""
-        page_color = palette_color(QPalette.Midlight)
-        bg_color = palette_color(QPalette.Window)
-        adjusted = ensure_contrast(page_color, bg_color, min_contrast_percent=10)
-        return adjusted.name()
+        return _slider_colors()[1]
 
     @staticmethod
     def _get_handlebackground() -> str:
         """Slider handle color with guaranteed contrast."""
-        if is_dark_theme():
-            handle_color = palette_color(QPalette.Light)
-        else:
-            handle_color = palette_color(QPalette.Dark)
-        bg_color = palette_color(QPalette.Window)
-        adjusted = ensure_contrast(handle_color, bg_color, min_contrast_percent=10)
-        return adjusted.name()
+        return _slider_colors()[2]
 
 
 # =============================================================================
 # Stylesheet Generator Functions
 # =============================================================================
-def docker_btn_style():
-    """Generate stylesheet for docker buttons."""
+# docker_btn_style results keyed by (selector, palette cacheKey); a theme
+# change produces a new palette key, so stale entries are never returned.
+# Only a couple of selectors are used, so the cache stays tiny.
+_DOCKER_BTN_STYLE_CACHE = {}
+
+
+def docker_btn_style(selector="QPushButton"):
+    """Generate stylesheet for docker buttons.
+
+    Args:
+        selector: QSS selector the rules apply to, e.g. an attribute selector
+                  like 'QPushButton[iconVariant="enhanced"]' for shared sheets.
+    """
+    cache_key = (selector, get_palette().cacheKey())
+    style = _DOCKER_BTN_STYLE_CACHE.get(cache_key)
+    if style is None:
+        style = _DOCKER_BTN_STYLE_CACHE[cache_key] = _build_docker_btn_style(selector)
+    return style
+
+
+def _build_docker_btn_style(selector):
+    """Build the docker button stylesheet for the current palette."""
     bg = DockerButtonColors.BackgroundNormal
     fg = DockerButtonColors.ForegroundNormal
     border = ButtonColors.BorderNormal
@@ -646,7 +795,7 @@ def docker_btn_style():
     border_pressed = ButtonColors.BorderPressed
 
     return f"""
-        QPushButton {{
+        {selector} {{
             background-color: {bg};
             color: {fg};
             font-size: {DockerButtonColors.FontSize};
@@ -655,11 +804,11 @@ def docker_btn_style():
             padding: 3px 6px;
             font-weight: 500;
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: {adjust_color(bg, 15)};
             border: 1px solid {border_hover};
         }}
-        QPushButton:pressed {{
+        {selector}:pressed {{
             background-color: {darken_color(bg, 15)};
             border: 1px solid {border_pressed};
         }}
@@ -668,10 +817,7 @@ def docker_btn_style():
 
 def shortcut_btn_style():
     """Generate stylesheet for shortcut buttons from config."""
-    config = get_common_config()
-    color = config["color"]["shortcut_button_background_color"]
-    font_color = config["color"]["shortcut_button_font_color"]
-    font_size = config["font"]["shortcut_button_font_size"]
+    color, font_color, font_size = get_shortcut_button_style_values()
     return f"background-color: {color}; color: {font_color}; font-size: {font_size};"
 
 
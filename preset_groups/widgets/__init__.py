@@ -6,10 +6,12 @@ Contains reusable UI widgets for brush buttons and grid containers.
 from .draggable_button import DraggableBrushButton
 from .grid_container import ClickableGridWidget, DraggableGridContainer
 from .draggable_grid_row import DraggableGridRow
+from .grid_name_button import GridNameButton
 
 __all__ = [
     "DraggableBrushButton",
     "ClickableGridWidget",
     "DraggableGridContainer",
     "DraggableGridRow",
+    "GridNameButton",
 ]
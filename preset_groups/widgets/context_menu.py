@@ -3,14 +3,28 @@
 Provides popup menus for single and multi-selection brush actions.
 """
 
-from PyQt5.QtWidgets import QFrame, QPushButton, QVBoxLayout
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QApplication, QFrame, QPushButton, QVBoxLayout
+from PyQt5.QtCore import Qt, QEvent
 from PyQt5.QtGui import QCursor
 
-from ..utils.styles import WindowColors, ButtonColors
+from ..utils.styles import WindowColors, ButtonColors, get_palette
+
+# Generated stylesheet and the palette cacheKey it was built for. Menus are
+# top-level windows, so each instance still sets the sheet, but the text is
+# only rebuilt when the theme changes.
+_CONTEXT_MENU_STYLE = [None, None]  # [palette cacheKey, stylesheet]
 
 
 def _get_context_menu_style():
+    """Return the context menu stylesheet for the current theme (cached)."""
+    key = get_palette().cacheKey()
+    if _CONTEXT_MENU_STYLE[0] != key:
+        _CONTEXT_MENU_STYLE[1] = _build_context_menu_style()
+        _CONTEXT_MENU_STYLE[0] = key
+    return _CONTEXT_MENU_STYLE[1]
+
+
+def _build_context_menu_style():
     """Generate the context menu stylesheet using theme colors."""
     return f"""
         QFrame {{
@@ -35,17 +49,50 @@ def _get_context_menu_style():
 class _BaseContextMenu(QFrame):
     """Base class for context menus with common setup."""
     
+    # One reusable instance per menu subclass, created on first use
+    _shared_instance = None
+    
     def __init__(self, on_remove):
         super().__init__()
         self._on_remove = on_remove
-        self._setup_ui()
+        self._style = None
+        self._built = False
+    
+    @classmethod
+    def shared(cls, on_remove):
+        """Return this menu kind's shared instance bound to on_remove.
+        
+        The frame, layout and button are built once; later calls only
+        rebind the callback.
+        """
+        menu = cls.__dict__.get("_shared_instance")
+        if menu is None:
+            menu = cls._shared_instance = cls(on_remove)
+        else:
+            menu._on_remove = on_remove
+        return menu
+    
+    def _ensure_built(self):
+        """Build the menu UI on first show, then keep its style current."""
+        if not self._built:
+            self._setup_ui()
+            self._built = True
+        else:
+            self._apply_style()
+    
+    def _apply_style(self):
+        """Set the themed stylesheet if it changed since last applied."""
+        style = _get_context_menu_style()
+        if style is not self._style:
+            self._style = style
+            self.setStyleSheet(style)
         
     def _setup_ui(self):
         """Configure the menu appearance and buttons."""
         self.setWindowFlags(
             Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool
         )
-        self.setStyleSheet(_get_context_menu_style())
+        self._apply_style()
         
         layout = QVBoxLayout()
         layout.setContentsMargins(2, 2, 2, 2)
@@ -60,18 +107,40 @@ class _BaseContextMenu(QFrame):
     
     def _handle_remove(self):
         """Execute remove callback and close menu."""
-        self._on_remove()
+        on_remove, self._on_remove = self._on_remove, None
         self.close()
+        if on_remove is not None:
+            on_remove()
     
     def show_at(self, position):
         """Display the menu at the given position."""
+        self._ensure_built()
         self.move(position)
+        # Stays-on-top tool window: show() already maps it above the docker
         self.show()
-        self.raise_()
     
     def show_at_cursor(self):
         """Display the menu at the current cursor position."""
         self.show_at(QCursor.pos())
+    
+    def showEvent(self, event):
+        """Watch application clicks only while the menu is visible."""
+        QApplication.instance().installEventFilter(self)
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        """Stop watching application clicks once the menu is hidden."""
+        QApplication.instance().removeEventFilter(self)
+        super().hideEvent(event)
+    
+    def eventFilter(self, obj, event):
+        """Close the menu and swallow the click when pressing outside it."""
+        if event.type() != QEvent.MouseButtonPress:
+            return False
+        if not self.geometry().contains(QCursor.pos()):
+            self.close()
+            return True
+        return False
 
 
 class BrushContextMenu(_BaseContextMenu):
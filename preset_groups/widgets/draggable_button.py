@@ -7,18 +7,22 @@ Each instance owns one Krita brush preset and is responsible for:
   - optionally displaying the brush name below the icon
 """
 
-from PyQt5.QtWidgets import QWidget, QPushButton, QApplication, QVBoxLayout, QLabel
-from PyQt5.QtCore import Qt, QPoint, QMimeData, QEvent
-from PyQt5.QtGui import QDrag, QIcon, QPixmap, QPainter, QColor, QPen, QCursor
+from collections import OrderedDict
+from functools import lru_cache
+
+from PyQt5.QtWidgets import QWidget, QApplication, QVBoxLayout, QLabel
+from PyQt5.QtCore import Qt, QPoint, QMimeData, QTimer
+from PyQt5.QtGui import QDrag, QPixmap, QPixmapCache, QPainter, QColor, QPen, QCursor
 
 from ..utils.config_utils import (
     get_brush_icon_size,
     get_display_brush_names,
     get_brush_name_font_size,
     get_brush_name_label_height,
+    get_brush_name_chars_per_line,
 )
 from ..utils.drag_utils import encode_single, encode_multi
-from ..utils.styles import SelectionColors, GridColors
+from ..utils.styles import SelectionColors, GridColors, get_palette
 from .context_menu import BrushContextMenu, MultiSelectContextMenu
 
 
@@ -26,44 +30,167 @@ from .context_menu import BrushContextMenu, MultiSelectContextMenu
 _HIGHLIGHT_BORDER_WIDTH = 12
 _LEFT_EDGE_WIDTH = 17
 _RIGHT_EDGE_WIDTH = 12
+_DRAG_PIXMAP_SIZE = 32
+
+# Composed icon pixmaps kept per button (hover x selected x edge states)
+_COMPOSED_CACHE_SIZE = 8
+
+
+def _stroke_width(width, scale):
+    """Scale a full-resolution stroke width to a scaled thumbnail."""
+    return max(1, round(width * scale))
+
+
+@lru_cache(maxsize=32)
+def _highlight_overlay(width, height, edge, rgba, scale=1.0):
+    """Pre-rendered transparent overlay holding a highlight stroke.
+    
+    edge is None for the full selection border, or 'left'/'right' for the
+    drop-position edge marker. Keyed by colour so theme changes miss.
+    scale shrinks the stroke widths, which are defined for full-resolution
+    thumbnails, to the size the overlay is drawn at.
+    """
+    overlay = QPixmap(width, height)
+    overlay.fill(Qt.transparent)
+    painter = QPainter(overlay)
+    pen = QPen(QColor.fromRgba(rgba))
+    painter.setBrush(Qt.NoBrush)
+    rect = overlay.rect().adjusted(1, 1, -2, -2)
+    if edge is None:
+        pen.setWidth(_stroke_width(_HIGHLIGHT_BORDER_WIDTH, scale))
+        painter.setPen(pen)
+        painter.drawRect(rect)
+    else:
+        # Axis-aligned line on integer coordinates: no antialiasing needed
+        pen.setWidth(_stroke_width(
+            _LEFT_EDGE_WIDTH if edge == 'left' else _RIGHT_EDGE_WIDTH, scale
+        ))
+        painter.setPen(pen)
+        x = rect.left() if edge == 'left' else rect.right()
+        painter.drawLine(x, rect.top(), x, rect.bottom())
+    painter.end()
+    return overlay
 
 
-class BrushIconButton(QPushButton):
-    """The icon/thumbnail portion of the brush button."""
+def _compose_icon(base, hovered, selected, edge=None, scale=1.0):
+    """Return a copy of base with hover, selection and edge overlays.
+    
+    The copy detaches from base once and all overlays are drawn through a
+    single painter, in a fixed order: hover darkening first (so borders are
+    not darkened), then the selection border, then the edge marker.
+    scale is base's size relative to the full-resolution thumbnail.
+    """
+    result = QPixmap(base)
+    if not (hovered or selected or edge):
+        return result
+    
+    painter = QPainter(result)
+    if hovered:
+        painter.fillRect(result.rect(), SelectionColors.HoverOverlayQColor)
+    if selected or edge:
+        width, height = result.width(), result.height()
+        rgba = SelectionColors.HighlightQColor.rgba()
+        if selected:
+            painter.drawPixmap(0, 0, _highlight_overlay(width, height, None, rgba, scale))
+        if edge:
+            painter.drawPixmap(0, 0, _highlight_overlay(width, height, edge, rgba, scale))
+    painter.end()
+    return result
+
+
+# Name label stylesheets keyed by (palette cacheKey, font size). Each sheet
+# carries both the normal and hover rule; hover flips a dynamic property.
+_NAME_LABEL_STYLE_CACHE = {}
+
+
+def _name_label_style(font_size):
+    """Return the name label stylesheet for the current theme and font size."""
+    key = (get_palette().cacheKey(), font_size)
+    style = _NAME_LABEL_STYLE_CACHE.get(key)
+    if style is None:
+        style = _NAME_LABEL_STYLE_CACHE[key] = f"""
+            QLabel {{
+                background-color: {GridColors.NameLabelBackground};
+                color: {GridColors.NameLabelText};
+                font-size: {font_size}px;
+                padding: 2px 1px;
+                border: none;
+            }}
+            QLabel[hover="true"] {{
+                background-color: {GridColors.NameLabelBackgroundHover};
+            }}
+        """
+    return style
+
+
+def _scaled_thumbnail_key(base_pixmap, icon_size):
+    """QPixmapCache key for a base thumbnail scaled to icon_size.
+    
+    Keyed by the base pixmap's cacheKey(), which every button sharing the
+    base through _base_pixmap_for sees, and which changes when a refresh
+    loads a new image, so stale sizes simply stop being hit.
+    """
+    return f"preset_groups:scaled:{base_pixmap.cacheKey()}:{icon_size}"
+
+
+def _base_pixmap_key(preset_name):
+    """QPixmapCache key for a preset's unscaled thumbnail."""
+    return f"preset_groups:{preset_name}:base"
+
+
+def _base_pixmap_for(preset, refresh=False):
+    """Return the preset thumbnail as a QPixmap, or None if it has no image.
+    
+    The QImage -> QPixmap conversion is shared through QPixmapCache by
+    preset name, so a preset shown in several grids is converted once.
+    Pass refresh=True to drop the cached copy and re-read the image.
+    """
+    key = _base_pixmap_key(preset.name())
+    if refresh:
+        QPixmapCache.remove(key)
+    else:
+        pixmap = QPixmapCache.find(key)
+        if pixmap is not None and not pixmap.isNull():
+            return pixmap
+    
+    image = preset.image()
+    if not image or image.isNull():
+        return None
+    pixmap = QPixmap.fromImage(image)
+    QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class BrushIconButton(QLabel):
+    """The icon/thumbnail portion of the brush button.
+    
+    A label showing the composed pixmap directly, already scaled to fit
+    with its aspect ratio kept and centred in the label; the thumbnail is
+    decorative, so it skips QIcon's mode/size variants.
+    Mouse events pass straight through to the parent brush button.
+    """
     
     def __init__(self, parent_widget):
         super().__init__()
         self.parent_widget = parent_widget
         self.original_pixmap = None
         self.current_edge_highlight = None
-        
-    def mousePressEvent(self, event):
-        self.parent_widget.handle_mouse_press(event)
-        
-    def mouseMoveEvent(self, event):
-        self.parent_widget.handle_mouse_move(event)
-        
-    def mouseReleaseEvent(self, event):
-        self.parent_widget.handle_mouse_release(event)
+        self.setAlignment(Qt.AlignCenter)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
 
 
 class ClickableNameLabel(QLabel):
-    """A clickable label for displaying the brush preset name."""
+    """A clickable label for displaying the brush preset name.
+    
+    Clicks pass straight through to the parent brush button.
+    """
     
     def __init__(self, parent_widget):
         super().__init__()
         self.parent_widget = parent_widget
         self.setAlignment(Qt.AlignCenter)
         self.setWordWrap(True)
-        
-    def mousePressEvent(self, event):
-        self.parent_widget.handle_mouse_press(event)
-        
-    def mouseMoveEvent(self, event):
-        self.parent_widget.handle_mouse_move(event)
-        
-    def mouseReleaseEvent(self, event):
-        self.parent_widget.handle_mouse_release(event)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
 
 
 class DraggableBrushButton(QWidget):
@@ -86,19 +213,25 @@ class DraggableBrushButton(QWidget):
         # Pixmap cache for edge highlighting
         self.original_pixmap = None
         self.current_edge_highlight = None
+        # Composed icons keyed by (palette key, icon size, hovered, selected, edge)
+        self._composed_cache = OrderedDict()
+        # Icon size awaiting a deferred recompose (None when nothing pending)
+        self._pending_icon_size = None
+        # Pixmap currently shown on the icon button, to skip no-op updates
+        self._shown_pixmap = None
         
         # Hover state
         self._is_hovered = False
         
         # Name label height tracking (set by grid for consistency)
         self._name_label_height = 0
+        # Stylesheet currently set on the name label
+        self._name_label_style = None
 
         self._setup_ui()
         self._setup_appearance()
-        
-        # Enable mouse tracking for hover detection
-        self.setMouseTracking(True)
-        self.setAttribute(Qt.WA_Hover, True)
+        # Hover is tracked through enterEvent/leaveEvent, which Qt delivers
+        # without mouse tracking or WA_Hover, so neither is enabled here
 
     def _setup_ui(self):
         """Setup the widget layout with icon button and name label."""
@@ -111,13 +244,27 @@ class DraggableBrushButton(QWidget):
         self.icon_button.setStyleSheet("border: none; padding: 0px;")
         layout.addWidget(self.icon_button)
         
-        # Name label (initially hidden, shown based on config)
-        self.name_label = ClickableNameLabel(self)
-        self.name_label.setVisible(False)
-        layout.addWidget(self.name_label)
+        # Name label is created on first use (see _ensure_name_label), so
+        # grids with names turned off carry no hidden label per button
+        self.name_label = None
         
         self.setLayout(layout)
 
+    def _ensure_name_label(self):
+        """Return the name label, creating and adding it on first use."""
+        if self.name_label is None:
+            self.name_label = ClickableNameLabel(self)
+            self.name_label.setText(self.preset.name())
+            self.name_label.setProperty("hover", self._is_hovered)
+            self._name_label_style = None
+            self.layout().addWidget(self.name_label)
+        return self.name_label
+
+    def _hide_name_label(self):
+        """Hide the name label if it exists."""
+        if self.name_label is not None:
+            self.name_label.setVisible(False)
+
     def _setup_appearance(self, is_selected=False):
         """Configure button size and icon."""
         icon_size = get_brush_icon_size()
@@ -128,68 +275,53 @@ class DraggableBrushButton(QWidget):
         # Set icon button size
         self.icon_button.setFixedSize(icon_size, icon_size)
         
-        if self.preset.image():
-            pixmap = QPixmap.fromImage(self.preset.image())
-            self.original_pixmap = QPixmap(pixmap)
-            if is_selected:
-                pixmap = self._add_highlight_border(pixmap)
-            self.icon_button.setIcon(QIcon(pixmap))
-            self.icon_button.setIconSize(self.icon_button.size())
+        pixmap = _base_pixmap_for(self.preset)
+        if pixmap is not None:
+            self._set_original_pixmap(pixmap)
+            self._set_icon_pixmap(self._compose(False, is_selected))
         else:
             self.icon_button.setText(self.preset.name()[:2])
         
         # Update name label
-        self._update_name_label(show_names)
+        self._update_name_label(show_names, icon_size)
         
         # Calculate total widget size
-        self._update_widget_size()
+        self._update_widget_size(icon_size, show_names)
 
-    def _update_name_label(self, show_names):
+    def _update_name_label(self, show_names, icon_size):
         """Update the name label appearance and visibility."""
         if not show_names:
-            self.name_label.setVisible(False)
+            self._hide_name_label()
             return
         
-        self.name_label.setVisible(True)
-        self.name_label.setText(self.preset.name())
-        
-        font_size = get_brush_name_font_size()
-        icon_size = get_brush_icon_size()
-        
-        self.name_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {GridColors.NameLabelBackground};
-                color: {GridColors.NameLabelText};
-                font-size: {font_size}px;
-                padding: 2px 1px;
-                border: none;
-            }}
-        """)
-        self.name_label.setFixedWidth(icon_size)
+        label = self._ensure_name_label()
+        label.setVisible(True)
+        label.setText(self.preset.name())
+        self._apply_name_label_style()
+        label.setFixedWidth(icon_size)
+
+    def _apply_name_label_style(self):
+        """Set the cached name label stylesheet if font size or theme changed."""
+        style = _name_label_style(get_brush_name_font_size())
+        if style is not self._name_label_style:
+            self._name_label_style = style
+            self.name_label.setStyleSheet(style)
 
     def set_name_label_height(self, height):
         """Set the name label height (called by grid for consistency across row)."""
         self._name_label_height = height
-        if get_display_brush_names() and height > 0:
-            self.name_label.setFixedHeight(height)
-            self.name_label.setVisible(True)
+        icon_size = get_brush_icon_size()
+        show_names = get_display_brush_names()
+        if show_names and height > 0:
+            label = self._ensure_name_label()
+            label.setFixedHeight(height)
+            label.setVisible(True)
             # Update the font size in the stylesheet as well
-            font_size = get_brush_name_font_size()
-            icon_size = get_brush_icon_size()
-            bg_color = GridColors.NameLabelBackgroundHover if self._is_hovered else GridColors.NameLabelBackground
-            self.name_label.setStyleSheet(f"""
-                QLabel {{
-                    background-color: {bg_color};
-                    color: {GridColors.NameLabelText};
-                    font-size: {font_size}px;
-                    padding: 2px 1px;
-                    border: none;
-                }}
-            """)
-            self.name_label.setFixedWidth(icon_size)
+            self._apply_name_label_style()
+            label.setFixedWidth(icon_size)
         else:
-            self.name_label.setVisible(False)
-        self._update_widget_size()
+            self._hide_name_label()
+        self._update_widget_size(icon_size, show_names)
 
     def resize_to_icon_size(self, icon_size, name_label_height):
         """Resize the button in-place to a new icon size without recreating it.
@@ -201,56 +333,45 @@ class DraggableBrushButton(QWidget):
         # Update icon button size
         self.icon_button.setFixedSize(icon_size, icon_size)
         
-        # Update icon pixmap to match new size
-        if self.original_pixmap:
-            scaled_pixmap = self.original_pixmap.scaled(
-                icon_size, icon_size,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            # Preserve selection state
-            if self._is_button_selected():
-                scaled_pixmap = self._add_highlight_border(scaled_pixmap)
-            # Preserve hover state
-            if self._is_hovered:
-                scaled_pixmap = self._apply_hover_darkening(scaled_pixmap)
-            self.icon_button.setIcon(QIcon(scaled_pixmap))
-            self.icon_button.setIconSize(self.icon_button.size())
+        # Recompose the icon pixmap once control returns to the event loop,
+        # so a burst of live resizes only paints the latest size
+        if self._pending_icon_size is None:
+            QTimer.singleShot(0, self._apply_pending_icon_size)
+        self._pending_icon_size = icon_size
         
         # Update name label if visible
         show_names = get_display_brush_names()
         if show_names and name_label_height > 0:
-            font_size = get_brush_name_font_size()
-            bg_color = GridColors.NameLabelBackgroundHover if self._is_hovered else GridColors.NameLabelBackground
-            self.name_label.setStyleSheet(f"""
-                QLabel {{
-                    background-color: {bg_color};
-                    color: {GridColors.NameLabelText};
-                    font-size: {font_size}px;
-                    padding: 2px 1px;
-                    border: none;
-                }}
-            """)
-            self.name_label.setFixedWidth(icon_size)
-            self.name_label.setFixedHeight(name_label_height)
-            self.name_label.setVisible(True)
+            label = self._ensure_name_label()
+            self._apply_name_label_style()
+            label.setFixedWidth(icon_size)
+            label.setFixedHeight(name_label_height)
+            label.setVisible(True)
             self._name_label_height = name_label_height
         else:
-            self.name_label.setVisible(False)
+            self._hide_name_label()
             self._name_label_height = 0
         
         # Update total widget size
-        if show_names and name_label_height > 0:
-            total_height = icon_size + name_label_height
-        else:
-            total_height = icon_size
-        self.setFixedSize(icon_size, total_height)
+        self._update_widget_size(icon_size, show_names)
 
-    def _update_widget_size(self):
-        """Update the total widget size based on icon and name label."""
-        icon_size = get_brush_icon_size()
-        show_names = get_display_brush_names()
+    def _apply_pending_icon_size(self):
+        """Rebuild the icon pixmap for the most recent resize_to_icon_size."""
+        icon_size = self._pending_icon_size
+        self._pending_icon_size = None
+        if icon_size is None:
+            return
         
+        # Icons composed at the old size won't be shown again
+        self._composed_cache.clear()
+        if self.original_pixmap:
+            # Preserve hover, selection and edge state
+            self._set_icon_pixmap(self._compose(
+                self._is_hovered, self._is_button_selected(), self.current_edge_highlight
+            ))
+
+    def _update_widget_size(self, icon_size, show_names):
+        """Update the total widget size based on icon and name label."""
         if show_names and self._name_label_height > 0:
             total_height = icon_size + self._name_label_height
         else:
@@ -276,25 +397,20 @@ class DraggableBrushButton(QWidget):
         self.preset = new_preset
         self.setToolTip(new_preset.name())
         
-        # Update the thumbnail
-        if new_preset.image():
-            pixmap = QPixmap.fromImage(new_preset.image())
-            self.original_pixmap = QPixmap(pixmap)
-            
-            # Apply current state
-            if self._is_hovered:
-                pixmap = self._apply_hover_darkening(pixmap)
-            if self._is_button_selected():
-                pixmap = self._add_highlight_border(pixmap)
-            
-            self.icon_button.setIcon(QIcon(pixmap))
-            self.icon_button.setIconSize(self.icon_button.size())
+        # Update the thumbnail, applying current state
+        # A different preset object may carry a new thumbnail under the same name
+        pixmap = _base_pixmap_for(new_preset, refresh=True)
+        if pixmap is not None:
+            self._set_original_pixmap(pixmap)
+            self._set_icon_pixmap(
+                self._compose(self._is_hovered, self._is_button_selected())
+            )
         else:
-            self.original_pixmap = None
+            self._set_original_pixmap(None)
             self.icon_button.setText(new_preset.name()[:2])
         
         # Update name label
-        if get_display_brush_names() and self.name_label.isVisible():
+        if self.name_label is not None:
             self.name_label.setText(new_preset.name())
     
     def force_refresh_thumbnail(self, preset=None):
@@ -314,25 +430,19 @@ class DraggableBrushButton(QWidget):
         
         self.setToolTip(self.preset.name())
         
-        if self.preset.image():
-            # Get fresh pixmap from preset image
-            pixmap = QPixmap.fromImage(self.preset.image())
-            self.original_pixmap = QPixmap(pixmap)
-            
-            # Apply current visual state
-            if self._is_hovered:
-                pixmap = self._apply_hover_darkening(pixmap)
-            if self._is_button_selected():
-                pixmap = self._add_highlight_border(pixmap)
-            
-            self.icon_button.setIcon(QIcon(pixmap))
-            self.icon_button.setIconSize(self.icon_button.size())
+        pixmap = _base_pixmap_for(self.preset, refresh=True)
+        if pixmap is not None:
+            # Fresh pixmap from the preset image, then apply current visual state
+            self._set_original_pixmap(pixmap)
+            self._set_icon_pixmap(
+                self._compose(self._is_hovered, self._is_button_selected())
+            )
         else:
-            self.original_pixmap = None
+            self._set_original_pixmap(None)
             self.icon_button.setText(self.preset.name()[:2])
         
-        # Update name label if visible
-        if get_display_brush_names() and self.name_label.isVisible():
+        # Update name label if it exists
+        if self.name_label is not None:
             self.name_label.setText(self.preset.name())
 
     def get_required_name_lines(self) -> int:
@@ -343,116 +453,108 @@ class DraggableBrushButton(QWidget):
         """
         if not get_display_brush_names():
             return 0
-            
-        icon_size = get_brush_icon_size()
-        font_size = get_brush_name_font_size()
-        
-        # Approximate characters per line based on icon width and font size
-        # Average character width is roughly 0.6 * font_size for sans-serif
-        avg_char_width = font_size * 0.55
-        chars_per_line = max(1, int((icon_size - 4) / avg_char_width))  # -4 for padding
         
-        name_length = len(self.preset.name())
-        
-        if name_length <= chars_per_line:
-            return 1
-        else:
-            return 2
+        chars_per_line = get_brush_name_chars_per_line(
+            get_brush_icon_size(), get_brush_name_font_size()
+        )
+        return 1 if len(self.preset.name()) <= chars_per_line else 2
 
     def refresh_appearance(self):
         """Refresh the button appearance after config changes."""
         is_selected = self._is_button_selected()
         self._setup_appearance(is_selected)
 
-    def _add_highlight_border(self, pixmap):
-        """Draw a highlight border on the pixmap."""
-        result = QPixmap(pixmap)
-        painter = QPainter(result)
-        pen = QPen(SelectionColors.HighlightQColor)
-        pen.setWidth(_HIGHLIGHT_BORDER_WIDTH)
-        painter.setPen(pen)
-        painter.setBrush(Qt.NoBrush)
-        painter.drawRect(result.rect().adjusted(1, 1, -2, -2))
-        painter.end()
-        return result
-
     def _get_base_pixmap(self):
         """Get the base pixmap, creating from preset if needed."""
         if self.original_pixmap:
             return QPixmap(self.original_pixmap)
-        if self.preset.image():
-            pixmap = QPixmap.fromImage(self.preset.image())
-            self.original_pixmap = QPixmap(pixmap)
-            return pixmap
+        pixmap = _base_pixmap_for(self.preset)
+        if pixmap is not None:
+            self._set_original_pixmap(pixmap)
+            return QPixmap(pixmap)
         return None
 
-    def _apply_hover_darkening(self, pixmap):
-        """Apply a dark overlay to the pixmap for hover effect."""
-        result = QPixmap(pixmap)
-        painter = QPainter(result)
-        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
-        painter.fillRect(result.rect(), SelectionColors.HoverOverlayQColor)
-        painter.end()
-        return result
+    def _set_original_pixmap(self, pixmap):
+        """Replace the base thumbnail and drop icons composed from the old one."""
+        self.original_pixmap = QPixmap(pixmap) if pixmap is not None else None
+        self._composed_cache.clear()
+        self._shown_pixmap = None
 
-    def _update_icon_for_hover(self):
-        """Update the icon button to reflect hover state."""
-        pixmap = self._get_base_pixmap()
-        if not pixmap:
-            return
-        
-        is_selected = self._is_button_selected()
-        
-        # Apply hover darkening FIRST (to base pixmap only)
-        if self._is_hovered:
-            pixmap = self._apply_hover_darkening(pixmap)
+    def _get_scaled_thumbnail(self, icon_size):
+        """Return the thumbnail smooth-scaled to icon_size (aspect kept).
         
-        # Apply selection highlight ON TOP (so it's not darkened)
-        if is_selected:
-            pixmap = self._add_highlight_border(pixmap)
+        Used as the base for composed grid icons and for the drag pixmap.
+        Scaled copies are shared through QPixmapCache by base pixmap, so
+        buttons showing the same preset scale it only once per size.
+        """
+        key = _scaled_thumbnail_key(self.original_pixmap, icon_size)
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None or pixmap.isNull():
+            pixmap = self.original_pixmap.scaled(
+                icon_size, icon_size,
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            )
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _compose(self, hovered, selected, edge=None):
+        """Return the base pixmap with hover, selection and edge overlays.
+        
+        Overlays are drawn on the shared thumbnail already scaled to the
+        icon size with its aspect ratio kept (so non-square thumbnails are
+        letterboxed rather than stretched), with stroke widths scaled to
+        match the full-resolution look. Results are cached per state so
+        toggling hover or selection reuses the composed pixmap instead of
+        repainting the overlays.
+        """
+        icon_size = self.icon_button.width()
+        key = (get_palette().cacheKey(), icon_size, hovered, selected, edge)
+        cache = self._composed_cache
+        pixmap = cache.get(key)
+        if pixmap is not None:
+            cache.move_to_end(key)
+            return pixmap
         
-        # Apply edge highlight on top
-        if self.current_edge_highlight:
-            pixmap = self._apply_edge_to_pixmap(pixmap, self.current_edge_highlight)
+        if not self.original_pixmap and self._get_base_pixmap() is None:
+            return None
+        base = self._get_scaled_thumbnail(icon_size)
+        # Rounded so same-sized thumbnails share overlay cache entries
+        scale = round(base.width() / max(1, self.original_pixmap.width()), 3)
+        pixmap = _compose_icon(base, hovered, selected, edge, scale)
         
-        self.icon_button.setIcon(QIcon(pixmap))
-        self.icon_button.setIconSize(self.icon_button.size())
+        cache[key] = pixmap
+        if len(cache) > _COMPOSED_CACHE_SIZE:
+            cache.popitem(last=False)
+        return pixmap
 
-    def _apply_edge_to_pixmap(self, pixmap, edge):
-        """Apply edge highlight to a pixmap."""
-        result = QPixmap(pixmap)
-        painter = QPainter(result)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        
-        pen = QPen(SelectionColors.HighlightQColor)
-        pen.setWidth(_LEFT_EDGE_WIDTH if edge == 'left' else _RIGHT_EDGE_WIDTH)
-        painter.setPen(pen)
-        painter.setBrush(Qt.NoBrush)
+    def _set_icon_pixmap(self, pixmap):
+        """Show a composed pixmap on the icon button.
         
-        rect = result.rect().adjusted(1, 1, -2, -2)
-        x = rect.left() if edge == 'left' else rect.right()
-        painter.drawLine(x, rect.top(), x, rect.bottom())
-        painter.end()
-        
-        return result
+        Composed pixmaps are cached per state, so getting the same object
+        back means the state is unchanged and the label is left alone.
+        """
+        if pixmap is None or pixmap is self._shown_pixmap:
+            return
+        self._shown_pixmap = pixmap
+        self.icon_button.setPixmap(pixmap)
+
+    def _update_icon_for_hover(self):
+        """Update the icon button to reflect hover state."""
+        self._set_icon_pixmap(self._compose(
+            self._is_hovered, self._is_button_selected(), self.current_edge_highlight
+        ))
 
     def _update_name_label_for_hover(self):
         """Update the name label background to reflect hover state."""
-        if not get_display_brush_names() or not self.name_label.isVisible():
+        if self.name_label is None:
             return
         
-        font_size = get_brush_name_font_size()
-        bg_color = GridColors.NameLabelBackgroundHover if self._is_hovered else GridColors.NameLabelBackground
-        
-        self.name_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {bg_color};
-                color: {GridColors.NameLabelText};
-                font-size: {font_size}px;
-                padding: 2px 1px;
-                border: none;
-            }}
-        """)
+        # The stylesheet already holds the hover rule; re-polish to apply it
+        label = self.name_label
+        label.setProperty("hover", self._is_hovered)
+        label.style().unpolish(label)
+        label.style().polish(label)
 
     def enterEvent(self, event):
         """Handle mouse entering the widget - apply hover darkening."""
@@ -470,23 +572,14 @@ class DraggableBrushButton(QWidget):
 
     def update_highlight(self, is_selected):
         """Update the button's highlight state (for current brush preset)."""
-        pixmap = self._get_base_pixmap()
-        if pixmap:
-            # Apply hover darkening FIRST (to base pixmap only)
-            if self._is_hovered:
-                pixmap = self._apply_hover_darkening(pixmap)
-            # Apply selection highlight ON TOP (so it's not darkened)
-            if is_selected:
-                pixmap = self._add_highlight_border(pixmap)
-            self.icon_button.setIcon(QIcon(pixmap))
-            self.icon_button.setIconSize(self.icon_button.size())
+        self._set_icon_pixmap(self._compose(self._is_hovered, is_selected))
     
     def update_selection_highlight(self, is_selected):
         """Update the button's selection highlight state (for multi-selection)."""
         self.update_highlight(is_selected)
 
     def handle_mouse_press(self, event):
-        """Handle mouse press events from child widgets."""
+        """Handle mouse press events on the button or its children."""
         if event.button() == Qt.LeftButton:
             self.drag_start_position = event.pos()
             self.is_dragging = False
@@ -599,18 +692,13 @@ class DraggableBrushButton(QWidget):
             self._close_context_menu()
             
             if len(self.parent_docker.selected_buttons) >= 2:
-                self._context_menu = MultiSelectContextMenu(
+                self._context_menu = MultiSelectContextMenu.shared(
                     self.parent_docker.remove_selected_brushes
                 )
-                self._context_menu.show_at(global_pos)
             else:
-                self._context_menu = BrushContextMenu(self._remove_from_grid)
-                self._context_menu.show_at_cursor()
-            
-            try:
-                QApplication.instance().installEventFilter(self)
-            except (RuntimeError, AttributeError):
-                pass
+                self._context_menu = BrushContextMenu.shared(self._remove_from_grid)
+            # The menu watches for outside clicks itself while it is shown
+            self._context_menu.show_at(global_pos)
         finally:
             self._menu_operation_in_progress = False
 
@@ -619,68 +707,26 @@ class DraggableBrushButton(QWidget):
         
         Handles edge cases where widget may be deleted or in inconsistent state.
         """
-        # Remove event filter first, before touching the menu
-        try:
-            app = QApplication.instance()
-            if app:
-                app.removeEventFilter(self)
-        except (RuntimeError, AttributeError):
-            pass
-        
-        # Now close and cleanup the menu
+        # Menus are shared instances, so hide, don't delete
         if self._context_menu:
             try:
                 menu = self._context_menu
                 self._context_menu = None  # Clear reference first
-                menu.hide()
                 menu.close()
-                menu.deleteLater()
             except (RuntimeError, AttributeError):
                 # Widget already deleted or in invalid state
                 self._context_menu = None
 
-    def eventFilter(self, obj, event):
-        """Close context menu when clicking outside.
+    def _get_buttons_in_grid_order(self):
+        """Get all preset buttons in grid layout order.
         
-        Includes safety checks to prevent crashes from rapid clicking.
-        PERFORMANCE: Only processes MouseButtonPress events when menu is visible.
+        Uses the grid's 1-based index map maintained by update_grid, which
+        is already in grid order; the layout is only walked as a fallback.
         """
-        # Fast path: only care about mouse button press events
-        if event.type() != QEvent.MouseButtonPress:
-            return False
-        
-        try:
-            # Safety check: ensure context menu exists and is valid
-            menu = self._context_menu
-            if menu is None:
-                return False
-            
-            # Check if menu widget is still valid (not deleted)
-            try:
-                is_visible = menu.isVisible()
-            except (RuntimeError, AttributeError):
-                # Widget was deleted, clean up reference
-                self._context_menu = None
-                return False
-            
-            if is_visible:
-                try:
-                    click_pos = QCursor.pos()
-                    menu_geometry = menu.geometry()
-                    if not menu_geometry.contains(click_pos):
-                        self._close_context_menu()
-                        return True
-                except (RuntimeError, AttributeError):
-                    # Widget became invalid during check
-                    self._context_menu = None
-        except Exception:
-            # Catch-all for any unexpected errors to prevent crashes
-            pass
+        index_map = self.grid_info.get("_index_map")
+        if index_map:
+            return list(index_map.values())
         
-        return False
-
-    def _get_buttons_in_grid_order(self):
-        """Get all preset buttons in grid layout order."""
         layout = self.grid_info.get("layout")
         if not layout:
             return []
@@ -719,14 +765,23 @@ class DraggableBrushButton(QWidget):
         
         drag = QDrag(self)
         drag.setMimeData(self._create_drag_mime_data())
-        drag.setPixmap(self.icon_button.icon().pixmap(32, 32))
-        drag.setHotSpot(QPoint(16, 16))
+        # Drag thumbnail comes from the shared scaled-thumbnail cache, so
+        # only the first drag of a preset pays for the smooth scale
+        if self.original_pixmap is not None:
+            drag.setPixmap(self._get_scaled_thumbnail(_DRAG_PIXMAP_SIZE))
+        drag.setHotSpot(QPoint(_DRAG_PIXMAP_SIZE // 2, _DRAG_PIXMAP_SIZE // 2))
         drag.exec_(Qt.MoveAction)
         
         self.parent_docker.stop_drag_tracking()
 
     def _find_button_index(self):
         """Find this button's index in the grid layout."""
+        # O(1) via the grid's index map when it still points at this button
+        grid_index = getattr(self, "grid_index", None)
+        if grid_index is not None:
+            if self.grid_info.get("_index_map", {}).get(grid_index) is self:
+                return grid_index - 1
+        
         layout = self.grid_info.get("layout")
         if not layout:
             return -1
@@ -767,49 +822,32 @@ class DraggableBrushButton(QWidget):
         return local_x < self.width() / 2
 
     def _is_button_selected(self):
-        """Check if this button is currently selected (brush or multi-select)."""
+        """Check if this button is currently selected (brush or multi-select).
+        
+        Identity checks run first so the common case (another button is the
+        current one) never reaches the preset name() calls.
+        """
         docker = self.parent_docker
         
-        is_current_brush = (
-            docker.current_selected_preset is not None
-            and self.preset.name() == docker.current_selected_preset.name()
-            and (docker.current_selected_button is None or docker.current_selected_button == self)
-        )
-        is_multi_selected = self in docker.selected_buttons
+        if self in docker.selected_buttons:
+            return True
         
-        return is_current_brush or is_multi_selected
+        current_preset = docker.current_selected_preset
+        if current_preset is None:
+            return False
+        current_button = docker.current_selected_button
+        if current_button is not None and current_button is not self:
+            return False
+        return self.preset.name() == current_preset.name()
 
     def highlight_edge(self, edge):
         """Highlight the left or right edge of the button's icon."""
         if not self.original_pixmap or self.current_edge_highlight == edge:
             return
         
-        pixmap = QPixmap(self.original_pixmap)
-        
-        # Apply hover darkening FIRST (to base pixmap only)
-        if self._is_hovered:
-            pixmap = self._apply_hover_darkening(pixmap)
-        
-        # Apply selection highlight ON TOP (so it's not darkened)
-        if self._is_button_selected():
-            pixmap = self._add_highlight_border(pixmap)
-        
-        # Apply edge highlight on top
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        
-        pen = QPen(SelectionColors.HighlightQColor)
-        pen.setWidth(_LEFT_EDGE_WIDTH if edge == 'left' else _RIGHT_EDGE_WIDTH)
-        painter.setPen(pen)
-        painter.setBrush(Qt.NoBrush)
-        
-        rect = pixmap.rect().adjusted(1, 1, -2, -2)
-        x = rect.left() if edge == 'left' else rect.right()
-        painter.drawLine(x, rect.top(), x, rect.bottom())
-        painter.end()
-        
-        self.icon_button.setIcon(QIcon(pixmap))
-        self.icon_button.setIconSize(self.icon_button.size())
+        self._set_icon_pixmap(
+            self._compose(self._is_hovered, self._is_button_selected(), edge)
+        )
         self.current_edge_highlight = edge
     
     def clear_edge_highlight(self):
@@ -817,16 +855,7 @@ class DraggableBrushButton(QWidget):
         if self.current_edge_highlight is None or not self.original_pixmap:
             return
         
-        pixmap = QPixmap(self.original_pixmap)
-        
-        # Apply hover darkening FIRST (to base pixmap only)
-        if self._is_hovered:
-            pixmap = self._apply_hover_darkening(pixmap)
-        
-        # Apply selection highlight ON TOP (so it's not darkened)
-        if self._is_button_selected():
-            pixmap = self._add_highlight_border(pixmap)
-        
-        self.icon_button.setIcon(QIcon(pixmap))
-        self.icon_button.setIconSize(self.icon_button.size())
+        self._set_icon_pixmap(
+            self._compose(self._is_hovered, self._is_button_selected())
+        )
         self.current_edge_highlight = None
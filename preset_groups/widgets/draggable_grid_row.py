@@ -5,18 +5,52 @@ allowing the entire row to be dragged to reorder grids. Supports
 multi-grid selection and drag with visual feedback for drop position.
 """
 
-from PyQt5.QtWidgets import QWidget, QHBoxLayout, QApplication
-from PyQt5.QtCore import Qt, QPoint, QMimeData, QRect, QEvent
-from PyQt5.QtGui import QDrag, QPainter, QColor
+from functools import lru_cache
 
-from ..utils.drag_utils import encode_grid_single, encode_grid_multi, is_grid_drag, decode_grid_single, decode_grid_multi
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QApplication, QPushButton
+from PyQt5.QtCore import Qt, QPoint, QMimeData, QRect, QByteArray
+from PyQt5.QtGui import QDrag, QPainter, QColor, QPixmap
+
+from ..utils.drag_utils import (
+    GRID_DRAG_MIME_TYPE,
+    encode_grid_single,
+    encode_grid_multi,
+    is_grid_drag,
+    is_grid_drag_mime,
+    decode_grid_single,
+    decode_grid_multi,
+)
 from ..utils.styles import SelectionColors, DragColors
 
 
 # Visual constants for drop zone highlighting
 _DROP_HIGHLIGHT_HEIGHT = 4  # Thicker highlight line for better visibility
 
+# Grid drag pixmap lists at most this many rows (the last one summarizes the rest)
+_DRAG_PIXMAP_MAX_ROWS = 10
+
 
+@lru_cache(maxsize=16)
+def _grid_drag_pixmap(grid_names, background_rgba, text_rgba):
+    """Drag pixmap listing grid names, one row each.
+    
+    Keyed by the names and colours, so renames and theme changes miss
+    instead of needing explicit invalidation.
+    """
+    height = 24 * len(grid_names)
+    width = 150
+    pixmap = QPixmap(width, height)
+    pixmap.fill(QColor.fromRgba(background_rgba))
+
+    painter = QPainter(pixmap)
+    painter.setPen(QColor.fromRgba(text_rgba))
+    for i, name in enumerate(grid_names):
+        painter.drawText(5, 18 + i * 24, name)
+    painter.end()
+    
+    return pixmap
+
+
 class DropIndicatorOverlay(QWidget):
     """Overlay widget that draws drop indicator on top of all other widgets."""
     
@@ -29,23 +63,30 @@ class DropIndicatorOverlay(QWidget):
         self.hide()
     
     def set_position(self, position):
-        """Set the indicator position ('top', 'bottom', or None to hide)."""
-        if position != self.position:
-            self.position = position
-            if position:
-                self.show()
-                self.raise_()
-            else:
-                self.hide()
+        """Set the indicator position ('top', 'bottom', or None to hide).
+        
+        Only a top/bottom flip on a visible overlay needs a repaint; showing
+        paints anyway and a hidden overlay needs no update.
+        """
+        if position == self.position:
+            return
+        was_shown = self.position is not None
+        self.position = position
+        if not position:
+            self.hide()
+        elif was_shown:
             self.update()
+        else:
+            self.show()
+            self.raise_()
     
     def paintEvent(self, event):
         """Paint the drop indicator overlay."""
         if not self.position:
             return
         
+        # Integer-aligned rect fill: antialiasing would only add cost
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
         painter.setBrush(SelectionColors.DropHighlightQColor)
         painter.setPen(Qt.NoPen)
         
@@ -60,6 +101,38 @@ class DropIndicatorOverlay(QWidget):
         painter.end()
 
 
+class RowDragSourceMixin:
+    """Forwards left-button press/move/release to the owning DraggableGridRow.
+    
+    Mixed into the header row's buttons so only these three mouse events
+    reach Python, instead of filtering every event the buttons receive.
+    Double-clicks are not forwarded, so inline rename keeps working.
+    """
+    
+    # Set by DraggableGridRow when the button is added to a row
+    drag_row = None
+    
+    def mousePressEvent(self, event):
+        if self.drag_row is not None:
+            self.drag_row.handle_child_press(self, event)
+        super().mousePressEvent(event)
+    
+    def mouseMoveEvent(self, event):
+        if self.drag_row is not None and self.drag_row.handle_child_move(self, event):
+            return
+        super().mouseMoveEvent(event)
+    
+    def mouseReleaseEvent(self, event):
+        if self.drag_row is not None:
+            self.drag_row.handle_child_release(event)
+        super().mouseReleaseEvent(event)
+
+
+class GridCollapseButton(RowDragSourceMixin, QPushButton):
+    """Collapse/expand button shown at the start of a grid's header row."""
+    pass
+
+
 class DraggableGridRow(QWidget):
     """A draggable widget containing the collapse button and name button for a grid."""
     
@@ -71,7 +144,6 @@ class DraggableGridRow(QWidget):
         # Drag state
         self.drag_start_position = QPoint()
         self.is_dragging = False
-        self._child_widgets = []
         
         # Drop indicator overlay (renders on top of everything)
         self._drop_overlay = DropIndicatorOverlay(self)
@@ -98,43 +170,40 @@ class DraggableGridRow(QWidget):
     def add_collapse_button(self, collapse_button):
         """Add the collapse button to this row."""
         self._layout.addWidget(collapse_button, alignment=Qt.AlignLeft)
-        self._child_widgets.append(collapse_button)
-        collapse_button.installEventFilter(self)
+        collapse_button.drag_row = self
     
     def add_name_button(self, name_button):
         """Add the name button to this row."""
         self._layout.addWidget(name_button, 1)
-        self._child_widgets.append(name_button)
-        name_button.installEventFilter(self)
+        name_button.drag_row = self
     
-    def eventFilter(self, obj, event):
-        """Intercept mouse events from child widgets to enable row-level dragging."""
-        if obj in self._child_widgets:
-            # Let double-click events pass through directly to enable inline rename
-            if event.type() == QEvent.MouseButtonDblClick:
-                return False  # Don't intercept, let the widget handle it
-            
-            if event.type() == QEvent.MouseButtonPress:
-                if event.button() == Qt.LeftButton:
-                    self.drag_start_position = self.mapFromGlobal(obj.mapToGlobal(event.pos()))
-                    self.is_dragging = False
-            
-            elif event.type() == QEvent.MouseMove:
-                if event.buttons() & Qt.LeftButton and self.drag_start_position:
-                    current_pos = self.mapFromGlobal(obj.mapToGlobal(event.pos()))
-                    distance = (current_pos - self.drag_start_position).manhattanLength()
-                    
-                    if distance >= QApplication.startDragDistance() and not self.is_dragging:
-                        self.is_dragging = True
-                        self._start_grid_drag()
-                        return True
-            
-            elif event.type() == QEvent.MouseButtonRelease:
-                if event.button() == Qt.LeftButton:
-                    self.is_dragging = False
-                    self.drag_start_position = QPoint()
+    def handle_child_press(self, child, event):
+        """Record the drag start for a press on a child button."""
+        if event.button() == Qt.LeftButton:
+            self.drag_start_position = child.mapTo(self, event.pos())
+            self.is_dragging = False
+    
+    def handle_child_move(self, child, event):
+        """Start a row drag from a child button; returns True if one started."""
+        if self.is_dragging or not (event.buttons() & Qt.LeftButton):
+            return False
+        if self.drag_start_position.isNull():
+            return False
+        
+        current_pos = child.mapTo(self, event.pos())
+        distance = (current_pos - self.drag_start_position).manhattanLength()
+        if distance < QApplication.startDragDistance():
+            return False
         
-        return super().eventFilter(obj, event)
+        self.is_dragging = True
+        self._start_grid_drag()
+        return True
+    
+    def handle_child_release(self, event):
+        """Reset drag state on a left-button release over a child button."""
+        if event.button() == Qt.LeftButton:
+            self.is_dragging = False
+            self.drag_start_position = QPoint()
     
     def mousePressEvent(self, event):
         """Handle mouse press for drag initiation."""
@@ -145,11 +214,14 @@ class DraggableGridRow(QWidget):
     
     def mouseMoveEvent(self, event):
         """Handle mouse move for drag operation."""
-        if not (event.buttons() & Qt.LeftButton) or not self.drag_start_position:
+        # No press on this row, or a drag is already running: nothing to do
+        if self.is_dragging or not (event.buttons() & Qt.LeftButton):
+            return
+        if self.drag_start_position.isNull():
             return
         
         distance = (event.pos() - self.drag_start_position).manhattanLength()
-        if distance >= QApplication.startDragDistance() and not self.is_dragging:
+        if distance >= QApplication.startDragDistance():
             self.is_dragging = True
             self._start_grid_drag()
     
@@ -165,26 +237,24 @@ class DraggableGridRow(QWidget):
         selected = self.parent_docker.selected_grids
         
         if len(selected) >= 2 and self.grid_info in selected:
-            return sorted(selected, key=lambda g: self.parent_docker.grids.index(g))
+            # One pass over the grids in display order instead of an
+            # index() scan per selected grid
+            selected_ids = {id(g) for g in selected}
+            return [g for g in self.parent_docker.grids if id(g) in selected_ids]
         
         return [self.grid_info]
     
     def _create_drag_pixmap(self, grids):
         """Create a visual representation of the grids being dragged."""
-        from PyQt5.QtGui import QPixmap
-        
-        height = 24 * len(grids)
-        width = 150
-        pixmap = QPixmap(width, height)
-        pixmap.fill(DragColors.PixmapBackgroundQColor)
-
-        painter = QPainter(pixmap)
-        painter.setPen(DragColors.PixmapTextQColor)
-        for i, grid in enumerate(grids):
-            painter.drawText(5, 18 + i * 24, grid.get("name", "Grid"))
-        painter.end()
-        
-        return pixmap
+        names = tuple(grid.get("name", "Grid") for grid in grids)
+        if len(names) > _DRAG_PIXMAP_MAX_ROWS:
+            shown = _DRAG_PIXMAP_MAX_ROWS - 1
+            names = names[:shown] + (f"+{len(names) - shown} more",)
+        return _grid_drag_pixmap(
+            names,
+            DragColors.PixmapBackgroundQColor.rgba(),
+            DragColors.PixmapTextQColor.rgba(),
+        )
     
     def _start_grid_drag(self):
         """Start the grid drag operation."""
@@ -202,6 +272,7 @@ class DraggableGridRow(QWidget):
             mime_data.setText(encode_grid_single(grids[0]["name"]))
         else:
             mime_data.setText(encode_grid_multi([g["name"] for g in grids]))
+        mime_data.setData(GRID_DRAG_MIME_TYPE, QByteArray())
         
         drag.setMimeData(mime_data)
         drag.setPixmap(self._create_drag_pixmap(grids))
@@ -212,14 +283,14 @@ class DraggableGridRow(QWidget):
     
     def dragEnterEvent(self, event):
         """Handle drag enter for receiving grid drops."""
-        if event.mimeData().hasText() and is_grid_drag(event.mimeData().text()):
+        if is_grid_drag_mime(event.mimeData()):
             if self.grid_info not in self.parent_docker.get_grids_being_dragged():
                 event.acceptProposedAction()
                 self._update_drop_position(event.pos())
     
     def dragMoveEvent(self, event):
         """Handle drag move to update drop position indicator."""
-        if event.mimeData().hasText() and is_grid_drag(event.mimeData().text()):
+        if is_grid_drag_mime(event.mimeData()):
             if self.grid_info not in self.parent_docker.get_grids_being_dragged():
                 event.acceptProposedAction()
                 self._update_drop_position(event.pos())
@@ -248,13 +319,11 @@ class DraggableGridRow(QWidget):
         if not grid_names:
             return
         
-        # Find source grids by name
-        source_grids = []
-        for name in grid_names:
-            for grid in self.parent_docker.grids:
-                if grid.get("name") == name:
-                    source_grids.append(grid)
-                    break
+        # Find source grids by name (one pass over the grids; first match wins)
+        grids_by_name = {}
+        for grid in self.parent_docker.grids:
+            grids_by_name.setdefault(grid.get("name"), grid)
+        source_grids = [grids_by_name[name] for name in grid_names if name in grids_by_name]
         
         if source_grids:
             insert_after = self.drop_position == 'bottom'
@@ -266,7 +335,7 @@ class DraggableGridRow(QWidget):
     
     def _update_drop_position(self, pos):
         """Update the drop position based on cursor location."""
-        new_position = 'top' if pos.y() < self.height() / 2 else 'bottom'
+        new_position = 'top' if pos.y() * 2 < self.height() else 'bottom'
         
         if new_position != self.drop_position:
             self.drop_position = new_position
@@ -16,7 +16,20 @@ from ..utils.config_utils import (
     get_display_brush_names,
     get_brush_name_label_height,
 )
-from ..utils.drag_utils import decode_single, decode_multi
+from ..utils.drag_utils import decode_single, decode_multi, is_brush_drag
+from .draggable_button import DraggableBrushButton
+
+
+def _build_preset_index(grids):
+    """Map preset name -> (preset, grid, index) in one pass over all grids.
+    
+    The first occurrence wins, matching a front-to-back linear search.
+    """
+    index = {}
+    for grid in grids:
+        for i, preset in enumerate(grid["brush_presets"]):
+            index.setdefault(preset.name(), (preset, grid, i))
+    return index
 
 
 class ClickableGridWidget(QWidget):
@@ -35,13 +48,13 @@ class ClickableGridWidget(QWidget):
             self.drag_start_position = event.pos()
             # Check if clicking on empty space (not on a button)
             widget_under_mouse = self.childAt(event.pos())
-            if not widget_under_mouse or not hasattr(widget_under_mouse, "preset"):
+            if not isinstance(widget_under_mouse, DraggableBrushButton):
                 # Clicked on grid area - set this grid as active
                 self.parent_docker.set_active_grid(self.grid_info)
         elif event.button() == Qt.RightButton:
             # Right-click outside buttons - deselect all
             widget_under_mouse = self.childAt(event.pos())
-            if not widget_under_mouse or not hasattr(widget_under_mouse, "preset"):
+            if not isinstance(widget_under_mouse, DraggableBrushButton):
                 self.parent_docker.clear_selection()
         super().mousePressEvent(event)
 
@@ -57,7 +70,7 @@ class ClickableGridWidget(QWidget):
 
         # Only start grid drag if clicking on empty space (not on brush buttons)
         widget_under_mouse = self.childAt(event.pos())
-        if widget_under_mouse and hasattr(widget_under_mouse, "preset"):
+        if isinstance(widget_under_mouse, DraggableBrushButton):
             return
 
         self.start_grid_drag()
@@ -73,10 +86,9 @@ class ClickableGridWidget(QWidget):
 
     def dragEnterEvent(self, event):
         """Handle drag enter events"""
-        if event.mimeData().hasText():
-            text = event.mimeData().text()
-            if text.startswith("brush_preset:") or text.startswith("brush_presets_multi:"):
-                event.acceptProposedAction()
+        mime_data = event.mimeData()
+        if mime_data.hasText() and is_brush_drag(mime_data.text()):
+            event.acceptProposedAction()
 
     def dropEvent(self, event):
         """Handle drop events"""
@@ -98,6 +110,13 @@ class ClickableGridWidget(QWidget):
             drop_pos = event.pos()
             target_index = self.calculate_drop_position(drop_pos)
 
+            # Dropped back onto its own slot: nothing to rebuild or save
+            if source_grid is self.grid_info:
+                last_index = len(source_grid["brush_presets"]) - 1
+                if min(target_index, last_index) == source_index:
+                    event.acceptProposedAction()
+                    return
+
             # Remove from old position
             source_grid["brush_presets"].pop(source_index)
 
@@ -110,8 +129,7 @@ class ClickableGridWidget(QWidget):
                 # Move between grids
                 target_index = min(target_index, len(self.grid_info["brush_presets"]))
                 self.grid_info["brush_presets"].insert(target_index, source_preset)
-                self.parent_docker.update_grid(source_grid)
-                self.parent_docker.update_grid(self.grid_info)
+                self.parent_docker.update_grids((source_grid, self.grid_info))
 
             self.parent_docker.save_grids_data()
             event.acceptProposedAction()
@@ -132,12 +150,15 @@ class ClickableGridWidget(QWidget):
             preset_names = [p.strip() for p in preset_names_str.split(",") if p.strip()]
         return preset_names
 
-    def _find_source_presets_data(self, preset_names):
+    def _find_source_presets_data(self, preset_names, preset_index=None):
         """Find all source presets and their positions"""
+        if preset_index is None:
+            preset_index = _build_preset_index(self.parent_docker.grids)
         source_presets_data = []
         for preset_name in preset_names:
-            preset_name = preset_name.strip()
-            source_preset, source_grid, source_index = self.find_source_preset(preset_name)
+            source_preset, source_grid, source_index = preset_index.get(
+                preset_name.strip(), (None, None, -1)
+            )
             if source_preset and source_grid is not None:
                 source_presets_data.append({
                     "preset": source_preset,
@@ -182,51 +203,71 @@ class ClickableGridWidget(QWidget):
         for i, preset in enumerate(presets_to_insert):
             target_grid["brush_presets"].insert(target_index + i, preset)
 
-    def _handle_same_grid_reorder(self, target_grid, presets_to_insert, source_presets_data, target_index):
-        """Handle reordering within the same grid"""
+    def _handle_same_grid_reorder(self, target_grid, presets_to_insert, source_presets_data, target_index, original_order):
+        """Handle reordering within the same grid.
+        
+        Returns False when the drop left the grid order unchanged, in which
+        case the grid is not rebuilt.
+        """
         original_indices = sorted([data["index"] for data in source_presets_data])
         adjusted_index = self._calculate_adjusted_target_index(target_index, original_indices, target_grid)
         self._insert_presets_at_target(target_grid, presets_to_insert, adjusted_index)
+        
+        presets = target_grid["brush_presets"]
+        if len(presets) == len(original_order) and all(
+            a is b for a, b in zip(presets, original_order)
+        ):
+            return False
         self.parent_docker.update_grid(target_grid)
+        return True
 
     def _handle_cross_grid_move(self, target_grid, presets_to_insert, grids_to_update, target_index):
         """Handle moving presets between different grids"""
         target_index = min(target_index, len(target_grid["brush_presets"]))
         self._insert_presets_at_target(target_grid, presets_to_insert, target_index)
-        self.parent_docker.update_grid(target_grid)
-        for grid_name, grid_data in grids_to_update.items():
-            if grid_data["grid_info"] != target_grid:
-                self.parent_docker.update_grid(grid_data["grid_info"])
+        self.parent_docker.update_grids(
+            [target_grid] + [grid_data["grid_info"] for grid_data in grids_to_update.values()]
+        )
 
     def handle_multi_brush_drop(self, event, text):
         """Handle multiple brush preset drop"""
         preset_names = self._parse_preset_names(text)
-        source_presets_data = self._find_source_presets_data(preset_names)
+        preset_index = _build_preset_index(self.parent_docker.grids)
+        source_presets_data = self._find_source_presets_data(preset_names, preset_index)
         if not source_presets_data:
             return
 
+        target_grid = self.grid_info
+        all_from_target = all(data["grid"] == target_grid for data in source_presets_data)
+        # Snapshot the order so a drop back in place can skip rebuild and save
+        original_order = list(target_grid["brush_presets"]) if all_from_target else None
+
         grids_to_update = self._group_presets_by_grid(source_presets_data)
         self._remove_presets_from_source_grids(grids_to_update)
 
         drop_pos = event.pos()
         target_index = self.calculate_drop_position(drop_pos)
         presets_to_insert = [data["preset"] for data in source_presets_data]
-        target_grid = self.grid_info
 
-        all_from_target = all(data["grid"] == target_grid for data in source_presets_data)
+        changed = True
         if all_from_target:
-            self._handle_same_grid_reorder(target_grid, presets_to_insert, source_presets_data, target_index)
+            changed = self._handle_same_grid_reorder(
+                target_grid, presets_to_insert, source_presets_data, target_index, original_order
+            )
         else:
             self._handle_cross_grid_move(target_grid, presets_to_insert, grids_to_update, target_index)
 
         self.parent_docker.clear_selection()
-        self.parent_docker.save_grids_data()
+        if changed:
+            self.parent_docker.save_grids_data()
         event.acceptProposedAction()
 
     def calculate_drop_position(self, drop_pos):
         """Calculate target position for drop"""
-        # Use dynamic columns from parent docker instead of config
-        columns = self.parent_docker.get_dynamic_columns()
+        # Columns this grid is currently laid out with: both layout paths
+        # (update_grid and the live icon-size resize) record it. Fall back
+        # to the docker's dynamic column count before the first layout.
+        columns = self.grid_info.get("columns") or self.parent_docker.get_dynamic_columns()
         button_size = get_brush_icon_size()
         spacing = get_spacing_between_buttons()
         
@@ -258,10 +299,9 @@ class DraggableGridContainer(QWidget):
 
     def dragEnterEvent(self, event):
         """Accept brush drags when hovering over the grid header/container."""
-        if event.mimeData().hasText():
-            text = event.mimeData().text()
-            if text.startswith("brush_preset:") or text.startswith("brush_presets_multi:"):
-                event.acceptProposedAction()
+        mime_data = event.mimeData()
+        if mime_data.hasText() and is_brush_drag(mime_data.text()):
+            event.acceptProposedAction()
 
     def dropEvent(self, event):
         """
@@ -319,11 +359,7 @@ class DraggableGridContainer(QWidget):
         target_grid["brush_presets"].insert(target_index, source_preset)
 
         # Update affected grids
-        if source_grid is target_grid:
-            self.parent_docker.update_grid(target_grid)
-        else:
-            self.parent_docker.update_grid(source_grid)
-            self.parent_docker.update_grid(target_grid)
+        self.parent_docker.update_grids((source_grid, target_grid))
 
         self.parent_docker.save_grids_data()
         event.acceptProposedAction()
@@ -334,10 +370,13 @@ class DraggableGridContainer(QWidget):
         preset_names_str = text.split(":", 1)[1]
         preset_names = [name.strip() for name in preset_names_str.split(",") if name.strip()]
 
-        # Find all source presets and their positions
+        # Find all source presets and their positions (one pass over grids)
+        preset_index = _build_preset_index(self.parent_docker.grids)
         source_presets_data = []
         for preset_name in preset_names:
-            source_preset, source_grid, source_index = self._find_source_preset(preset_name)
+            source_preset, source_grid, source_index = preset_index.get(
+                preset_name, (None, None, -1)
+            )
             if source_preset and source_grid is not None:
                 source_presets_data.append(
                     {"preset": source_preset, "grid": source_grid, "index": source_index}
@@ -368,11 +407,9 @@ class DraggableGridContainer(QWidget):
             target_grid["brush_presets"].append(data["preset"])
 
         # Update affected grids
-        for grid_data in grids_to_update.values():
-            grid_info = grid_data["grid_info"]
-            self.parent_docker.update_grid(grid_info)
-        if target_grid not in [g["grid_info"] for g in grids_to_update.values()]:
-            self.parent_docker.update_grid(target_grid)
+        self.parent_docker.update_grids(
+            [grid_data["grid_info"] for grid_data in grids_to_update.values()] + [target_grid]
+        )
 
         # Clear selection and save
         self.parent_docker.clear_selection()
@@ -0,0 +1,37 @@
+"""Grid name button widget.
+
+Header button showing a grid's name; mouse events are forwarded to the
+docker's NameButtonEventsMixin handlers.
+"""
+
+from PyQt5.QtWidgets import QPushButton
+
+from .draggable_grid_row import RowDragSourceMixin
+
+
+class GridNameButton(RowDragSourceMixin, QPushButton):
+    """Grid name button that forwards mouse events to the docker.
+
+    Event methods are defined once on the class and dispatch to the shared
+    NameButtonEventsMixin handlers, instead of assigning per-instance closures.
+    Row dragging is handled by RowDragSourceMixin, which forwards to the
+    parent DraggableGridRow widget.
+    """
+
+    def __init__(self, grid_info, parent_docker):
+        super().__init__(grid_info["name"])
+        self.grid_info = grid_info
+        self.parent_docker = parent_docker
+        self.click_pos = None
+
+    def mousePressEvent(self, event):
+        self.parent_docker._on_name_button_press(self, self.grid_info, event)
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        self.parent_docker._on_name_button_release(self, self.grid_info, event)
+        super().mouseReleaseEvent(event)
+
+    def mouseDoubleClickEvent(self, event):
+        self.parent_docker._on_name_button_double_click(self, self.grid_info, event)
+        super().mouseDoubleClickEvent(event)